@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Numerical Kernel Benchmarks
+===========================
+
+Timing suite for the hot paths of the analysis scripts:
+- Scalar and batch gravitational force with wavelength corrections
+- solve_ivp integration of the coupled Friedmann-field equations
+- Structure formation growth factor (closed form and tabulated growth ODE)
+- FFTLog correlation function and top-hat σ(R) over many radii and redshifts
+- CMB C_l modification on every multipole for a batch of couplings
+- BAO scales for many parameter sets and survey bins
+- Fisher matrices (complex-step and stacked finite-difference Jacobians)
+- Joint likelihood over a walker population and ensemble MCMC steps
+- Exclusion-region scan of a 5-D coupling grid and adaptive boundary refinement
+- Solar system tests over a synthetic million-body catalogue
+- Double-double totals of a million tiny corrections
+- Figure rendering functions
+
+Each round repeats a kernel until it lasts at least MIN_ROUND_TIME, so that
+sub-millisecond kernels are not timed at the resolution of scheduler noise. The
+best (minimum) per-call time over the rounds is compared with the stored minimum
+in benchmarks/baseline.json; the run fails when a kernel is slower than its
+baseline by more than its threshold factor (DEFAULT_THRESHOLD unless the
+benchmark sets its own, or --threshold for all).
+
+Usage:
+    python benchmarks/run_benchmarks.py                  # compare with baseline
+    python benchmarks/run_benchmarks.py --save-baseline --repeat 5  # record a new baseline
+    python benchmarks/run_benchmarks.py -k force         # only matching benchmarks
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARK_DIR, '..', 'src'))
+
+import numpy as np
+
+import background_cosmology
+import bao_forecast
+import cmb_modification
+import comprehensive_critique_solutions
+import correlation
+import enhanced_manuscript_improvements
+import exclusion_scanner
+import fisher_forecast
+import fundamental_derivations_response
+import parameter_likelihood
+import power_spectrum
+import precision
+import solar_system_batch
+import theoretical_foundations
+from wavelength_field_validation import WorkingWavelengthFieldTheory
+
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baseline.json')
+DEFAULT_THRESHOLD = 1.5  # fail when the best time > threshold * baseline best time
+NOISY_THRESHOLD = 2.0  # Python-bound ODE solves and matplotlib rendering vary more between runs
+MIN_ROUND_TIME = 0.1  # s; short kernels are repeated within a round until it lasts this long
+
+BENCHMARKS = {}
+
+def benchmark(name, rounds=5, setup=None, threshold=DEFAULT_THRESHOLD):
+    """Register a benchmark; setup() returns the arguments passed to the timed function"""
+    def register(func):
+        BENCHMARKS[name] = {'func': func, 'rounds': rounds, 'setup': setup, 'threshold': threshold}
+        return func
+    return register
+
+@contextlib.contextmanager
+def scratch_directory():
+    """Run figure functions in a temporary tree so figures/ is not overwritten"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'figures'))
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+def force_pairs(n_pairs, seed=0):
+    """Random (mass1, mass2, distance) arrays spanning the validation scales"""
+    rng = np.random.default_rng(seed)
+    mass1 = 10**rng.uniform(-30, 31, n_pairs)
+    mass2 = 10**rng.uniform(-30, 31, n_pairs)
+    distance = 10**rng.uniform(-15, 12, n_pairs)
+    return WorkingWavelengthFieldTheory(), mass1, mass2, distance
+
+@benchmark('force_scalar_1k', setup=lambda: force_pairs(1000))
+def bench_force_scalar(wft, mass1, mass2, distance):
+    for m1, m2, r in zip(mass1.tolist(), mass2.tolist(), distance.tolist()):
+        wft.gravitational_force_with_wavelength_corrections(m1, m2, r)
+
+@benchmark('force_batch_100k', setup=lambda: force_pairs(100000))
+def bench_force_batch(wft, mass1, mass2, distance):
+    wft.gravitational_force_batch(mass1, mass2, distance)
+
+@benchmark('cosmology_integration_rk45', threshold=NOISY_THRESHOLD)
+def bench_cosmology_integration():
+    comprehensive_critique_solutions.integrate_cosmology()
+
+# Heavy field from a small initial scale factor: thousands of steps
+HEAVY_FIELD = {'params': {'m_phi': 1e3}, 'a_initial': 1e-6, 't_span': (1e-6, 1.0),
+               't_eval': np.logspace(-6, 0, 200)}
+
+@benchmark('cosmology_heavy_field_rk45', rounds=3, threshold=NOISY_THRESHOLD)
+def bench_cosmology_heavy_field_rk45():
+    comprehensive_critique_solutions.integrate_cosmology(method='RK45', **HEAVY_FIELD)
+
+@benchmark('cosmology_heavy_field_lsoda', rounds=3, threshold=NOISY_THRESHOLD)
+def bench_cosmology_heavy_field_lsoda():
+    comprehensive_critique_solutions.integrate_cosmology(method='LSODA', **HEAVY_FIELD)
+
+@benchmark('growth_factor_1m', rounds=10, setup=lambda: (np.linspace(0, 10, 1000000),))
+def bench_growth_factor(z):
+    theoretical_foundations.growth_factor(z)
+
+@benchmark('growth_ode_tabulation', rounds=10)
+def bench_growth_ode_tabulation():
+    background_cosmology.BackgroundCosmology().linear_growth
+
+@benchmark('power_evolution_500z', rounds=10,
+           setup=lambda: (np.logspace(-4, 2, 1000), np.linspace(0, 10, 500)))
+def bench_power_evolution(k, z):
+    background_cosmology.get_background().linear_growth.evolve_power(k**-3, z)
+
+@benchmark('correlation_xi_5000r_50z', rounds=10,
+           setup=lambda: (np.logspace(0, 2.3, 5000), np.linspace(0, 3, 50)))
+def bench_correlation_xi(r, z):
+    correlation.CorrelationFunction(power_spectrum.PowerSpectrum()).xi(r, z)
+
+@benchmark('sigma_R_1000r', rounds=5, setup=lambda: (np.logspace(-1, 2, 1000),))
+def bench_sigma_R(R):
+    correlation.CorrelationFunction(power_spectrum.PowerSpectrum()).sigma(R)
+
+@benchmark('cmb_modification_1000alpha', rounds=10,
+           setup=lambda: (cmb_modification.alpha * np.logspace(-1, 1, 1000),))
+def bench_cmb_modification(couplings):
+    cmb_modification.CMBModification().delta(couplings)
+
+@benchmark('bao_scales_10k_configurations', rounds=10,
+           setup=lambda: (bao_forecast.effective_redshifts(bao_forecast.SURVEYS['DESI']),
+                          bao_forecast.parameter_sets(Omega_m=np.linspace(0.27, 0.35, 10000))))
+def bench_bao_scales(z, params):
+    bao_forecast.bao_scales(z, params)
+
+@benchmark('fisher_10k_configurations', rounds=10,
+           setup=lambda: (np.random.default_rng(0).uniform(0.5, 2.0, (10000, 5)),))
+def bench_fisher(scale):
+    observables = fisher_forecast.default_observables()
+    fisher_forecast.forecast_errors(fisher_forecast.fisher_matrices(observables, precision_scale=scale))
+
+@benchmark('joint_likelihood_1k_walkers', rounds=10,
+           setup=lambda: (parameter_likelihood.JointLikelihood(),
+                          parameter_likelihood.initial_walkers(1000, np.random.default_rng(0))))
+def bench_joint_likelihood(likelihood, walkers):
+    likelihood(walkers)
+
+@benchmark('mcmc_200_steps_64_walkers', rounds=3)
+def bench_mcmc():
+    likelihood = parameter_likelihood.JointLikelihood()
+    initial = parameter_likelihood.initial_walkers(64, np.random.default_rng(0))
+    with tempfile.TemporaryDirectory() as tmp:
+        sampler = parameter_likelihood.EnsembleSampler(likelihood, 64, len(initial[0]))
+        sampler.run(initial, 200, checkpoint=tmp, resume=False)
+
+@benchmark('exclusion_scan_10m_points', rounds=5,
+           setup=lambda: ({name: np.logspace(-20, 0, 25) for name in exclusion_scanner.PARAMETER_NAMES},))
+def bench_exclusion_scan(axes):
+    exclusion_scanner.scan(axes, memory_mb=64)
+
+@benchmark('adaptive_scan_7_levels', rounds=5)
+def bench_adaptive_scan():
+    exclusion_scanner.adaptive_scan({'m_phi': (1e-20, 1.0), 'g1': (1e-10, 1e-2)}, coarse_points=9, levels=7)
+
+@benchmark('solar_system_tests_1m_bodies', rounds=5,
+           setup=lambda: (solar_system_batch.random_catalogue(1000000),))
+def bench_solar_system_tests(bodies):
+    solar_system_batch.solar_system_tests(bodies)
+
+@benchmark('double_double_1m_corrections', rounds=5,
+           setup=lambda: (precision.Corrected(np.linspace(1, 10, 1000000), np.logspace(-300, -1, 1000000)),))
+def bench_double_double(value):
+    value.total('double-double')
+
+@benchmark('figure_structure_formation', rounds=3, threshold=NOISY_THRESHOLD)
+def bench_structure_formation_figure():
+    with scratch_directory():
+        theoretical_foundations.AdvancedWavelengthFieldTheory().detailed_structure_formation()
+
+@benchmark('figure_cosmological_evolution', rounds=3, threshold=NOISY_THRESHOLD)
+def bench_cosmological_evolution_figure():
+    with scratch_directory():
+        comprehensive_critique_solutions.ComprehensiveCritiqueSolutions().complete_cosmological_evolution()
+
+@benchmark('figure_comprehensive_diagrams', rounds=3, threshold=NOISY_THRESHOLD)
+def bench_comprehensive_diagrams():
+    with scratch_directory():
+        comprehensive_critique_solutions.create_comprehensive_diagrams()
+
+@benchmark('figure_parameter_constraints', rounds=3, threshold=NOISY_THRESHOLD)
+def bench_parameter_constraint_plot():
+    with scratch_directory():
+        fundamental_derivations_response.create_parameter_constraint_plot()
+
+@benchmark('figure_enhanced_manuscript', rounds=3, threshold=NOISY_THRESHOLD)
+def bench_enhanced_manuscript_figures():
+    with scratch_directory():
+        enhanced_manuscript_improvements.create_comprehensive_figures()
+
+def _time_calls(func, args, number):
+    """Seconds per call of func(*args), averaged over `number` back-to-back calls"""
+    start = time.perf_counter()
+    for _ in range(number):
+        func(*args)
+    return (time.perf_counter() - start) / number
+
+def run_benchmark(name, rounds=None, min_round_time=MIN_ROUND_TIME):
+    """Time one benchmark; returns per-call timing statistics in seconds"""
+    case = BENCHMARKS[name]
+    args = case['setup']() if case['setup'] else ()
+    rounds = rounds or case['rounds']
+    with contextlib.redirect_stdout(io.StringIO()):
+        case['func'](*args)  # warm-up (imports, caches, first-call allocation)
+        single = _time_calls(case['func'], args, 1)
+        number = max(1, math.ceil(min_round_time / max(single, 1e-9)))
+        times = [_time_calls(case['func'], args, number) for _ in range(rounds)]
+    return {
+        'median': statistics.median(times),
+        'min': min(times),
+        'max': max(times),
+        'rounds': rounds,
+        'number': number
+    }
+
+def median_statistics(runs):
+    """Per-statistic median over repeated runs of one benchmark"""
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+def machine_info():
+    """Description of the machine and library versions a baseline was recorded on"""
+    import matplotlib
+    import scipy
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'matplotlib': matplotlib.__version__
+    }
+
+def load_baseline(path=BASELINE_PATH):
+    """Baseline timings, or None if none has been recorded"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def save_baseline(results, path=BASELINE_PATH):
+    """Store median timings as the new baseline (merging with existing entries)"""
+    baseline = load_baseline(path) or {'benchmarks': {}}
+    baseline['machine'] = machine_info()
+    baseline['recorded'] = time.strftime('%Y-%m-%d')
+    for name, stats in results.items():
+        baseline['benchmarks'][name] = {'median': stats['median'], 'min': stats['min']}
+    baseline['benchmarks'] = dict(sorted(baseline['benchmarks'].items()))
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+    return path
+
+def compare(results, baseline, threshold=None):
+    """
+    Print best times against the baseline; returns the names of regressed benchmarks
+
+    threshold overrides the per-benchmark thresholds when given.
+    """
+    reference = (baseline or {}).get('benchmarks', {})
+    regressions = []
+    print(f"\n{'Benchmark':<32} {'Best':>10} {'Baseline':>10} {'Ratio':>7} {'Limit':>6}")
+    print("-" * 71)
+    for name, stats in results.items():
+        best = stats['min']
+        limit = threshold or BENCHMARKS[name]['threshold']
+        if name not in reference:
+            print(f"🆕 {name:<30} {best*1e3:8.3f}ms {'-':>10} {'-':>7} {limit:5.2f}x")
+            continue
+        ratio = best / reference[name]['min']
+        regressed = ratio > limit
+        symbol = '❌' if regressed else ('🚀' if ratio < 1 / limit else '✅')
+        print(f"{symbol} {name:<30} {best*1e3:8.3f}ms {reference[name]['min']*1e3:8.3f}ms {ratio:6.2f}x "
+              f"{limit:5.2f}x")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+def main(argv=None):
+    """Run the benchmark suite"""
+    parser = argparse.ArgumentParser(description="Benchmark the numerical kernels")
+    parser.add_argument('-k', dest='pattern', default='',
+                        help="only run benchmarks whose name contains this string")
+    parser.add_argument('--rounds', type=int, default=None, help="override the number of timed rounds")
+    parser.add_argument('--repeat', type=int, default=1,
+                        help="run the suite this many times and keep the median statistics")
+    parser.add_argument('--threshold', type=float, default=None,
+                        help=f"allowed slowdown factor for every benchmark "
+                             f"(default: per benchmark, mostly {DEFAULT_THRESHOLD})")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="record the results as the new baseline")
+    parser.add_argument('--json', metavar='PATH', help="also write the raw results to a JSON file")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.pattern in name]
+    print("WAVELENGTH FIELD THEORY - KERNEL BENCHMARKS")
+    print("=" * 64)
+    runs = {name: [] for name in names}
+    for repeat in range(args.repeat):
+        for name in names:
+            print(f"⏱️  {name}{f' ({repeat + 1}/{args.repeat})' if args.repeat > 1 else ''}...", flush=True)
+            runs[name].append(run_benchmark(name, args.rounds))
+    results = {name: median_statistics(stats) for name, stats in runs.items()}
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'machine': machine_info(), 'benchmarks': results}, f, indent=2)
+
+    if args.save_baseline:
+        compare(results, None)
+        print(f"\n💾 Baseline saved to {save_baseline(results, args.baseline)}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    regressions = compare(results, baseline, args.threshold)
+    if baseline is None:
+        print(f"\n⚠️  No baseline at {args.baseline} - run with --save-baseline")
+    elif baseline.get('machine', {}).get('platform') != platform.platform():
+        print(f"\n⚠️  Baseline was recorded on {baseline['machine'].get('platform')}; ratios are indicative only")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed beyond their limit: {', '.join(regressions)}")
+        return 1
+    print("\n✅ No performance regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
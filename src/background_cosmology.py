@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Shared Background Cosmology
+===========================
+
+One cached description of the homogeneous background used across the scripts:
+- E(z) = H(z)/H0 for matter, radiation, curvature and Λ
+- Critical density ρ_c(z) in kg/m³ and physical densities Ω h²
+- Comoving distance from a precomputed cumulative table (spline lookup)
+- Approximate growth factor with the wavelength field α² ln a modification
+- Linear growth D(z), f(z) from the growth ODE, solved once and tabulated
+- expansion_rate, distance_integral and transverse_distance broadcast over
+  arrays of parameter sets, for consumers that need thousands of cosmologies
+
+get_background() returns one instance per parameter set from an LRU cache, so
+every consumer reuses the same precomputed tables instead of rebuilding them.
+"""
+
+from functools import cached_property, lru_cache
+
+import numpy as np
+from scipy import constants
+from scipy.integrate import cumulative_trapezoid, solve_ivp
+from scipy.interpolate import CubicSpline
+
+# Physical constants
+c = constants.c
+G = constants.G
+alpha = constants.alpha
+MPC = 1e6 * constants.parsec  # m
+
+# Fiducial background used throughout the analysis
+FIDUCIAL = {'H0': 70.0, 'Omega_m': 0.31, 'Omega_r': 0.0, 'Omega_Lambda': 0.69}
+
+def curvature(Omega_m, Omega_r, Omega_Lambda):
+    """Ω_k = 1 - Ω_m - Ω_r - Ω_Λ, with rounding residues below 1e-12 set to 0"""
+    Omega_k = 1.0 - np.asarray(Omega_m) - Omega_r - Omega_Lambda
+    return np.where(np.abs(Omega_k) > 1e-12, Omega_k, 0.0)
+
+def expansion_rate(z, Omega_m, Omega_r=0.0, Omega_Lambda=0.69, Omega_k=None):
+    """E(z) = H(z)/H0; the density parameters broadcast against z"""
+    zp1 = 1 + np.asarray(z, dtype=float)
+    if Omega_k is None:
+        Omega_k = curvature(Omega_m, Omega_r, Omega_Lambda)
+    # Ω_r (1+z)⁴ + Ω_m (1+z)³ + Ω_k (1+z)² + Ω_Λ in Horner form
+    return np.sqrt(((Omega_r * zp1 + Omega_m) * zp1 + Omega_k) * zp1 * zp1 + Omega_Lambda)
+
+def distance_integral(x, Omega_m, Omega_r=0.0, Omega_Lambda=0.69):
+    """
+    Cumulative χ/D_H = ∫ (1+z)/E(z) dx at the even nodes x[::2] of an x = ln(1+z) grid
+
+    x is 1-D with x[0] = 0 and pairs of equal steps (so it may be piecewise
+    uniform); the density parameters broadcast against it, e.g. as (n, 1)
+    columns for n parameter sets. The trapezoid rule is Richardson-corrected
+    with the even-node rule, i.e. Simpson's rule per pair of steps.
+    """
+    integrand = np.exp(x) / expansion_rate(np.expm1(x), Omega_m, Omega_r, Omega_Lambda)  # dχ/dx = (1+z)/E(z)
+    chi = cumulative_trapezoid(integrand, x, initial=0, axis=-1)[..., ::2]
+    chi_coarse = cumulative_trapezoid(integrand[..., ::2], x[::2], initial=0, axis=-1)
+    return chi + (chi - chi_coarse) / 3
+
+def transverse_distance(chi, hubble_distance, Omega_k):
+    """Transverse comoving distance D_M from the line-of-sight χ (all in the units of hubble_distance)"""
+    Omega_k = np.asarray(Omega_k, dtype=float)
+    sqrt_k = np.sqrt(np.abs(Omega_k))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = sqrt_k * chi / hubble_distance
+        curved = hubble_distance / sqrt_k * np.where(Omega_k > 0, np.sinh(x), np.sin(x))
+    return np.where(Omega_k != 0, curved, chi)
+
+class BackgroundCosmology:
+    """Homogeneous FRW background with memoized derived quantities"""
+
+    def __init__(self, H0=70.0, Omega_m=0.31, Omega_r=0.0, Omega_Lambda=0.69, z_table_max=1100.0):
+        self.H0 = H0
+        self.Omega_m = Omega_m
+        self.Omega_r = Omega_r
+        self.Omega_Lambda = Omega_Lambda
+        self.Omega_k = float(curvature(Omega_m, Omega_r, Omega_Lambda))
+        self.z_table_max = z_table_max
+
+    def __repr__(self):
+        return (f"BackgroundCosmology(H0={self.H0}, Omega_m={self.Omega_m}, "
+                f"Omega_r={self.Omega_r}, Omega_Lambda={self.Omega_Lambda})")
+
+    def E(self, z):
+        """Dimensionless expansion rate H(z)/H0"""
+        return expansion_rate(z, self.Omega_m, self.Omega_r, self.Omega_Lambda, self.Omega_k)
+
+    def hubble(self, z=0.0):
+        """H(z) in km/s/Mpc"""
+        return self.H0 * self.E(z)
+
+    @cached_property
+    def H0_si(self):
+        """H0 in 1/s"""
+        return self.H0 * 1e3 / MPC
+
+    @cached_property
+    def hubble_distance(self):
+        """c/H0 in Mpc"""
+        return c / 1000 / self.H0
+
+    @cached_property
+    def rho_critical0(self):
+        """Critical density today in kg/m³"""
+        return 3 * self.H0_si**2 / (8 * np.pi * G)
+
+    def critical_density(self, z=0.0):
+        """Critical density ρ_c(z) = 3H(z)²/(8πG) in kg/m³"""
+        return self.rho_critical0 * self.E(z)**2
+
+    @cached_property
+    def physical_densities(self):
+        """(Ω_m h², Ω_r h², Ω_Λ h²) with h = H0/100"""
+        h2 = (self.H0/100)**2
+        return self.Omega_m * h2, self.Omega_r * h2, self.Omega_Lambda * h2
+
+    @cached_property
+    def _distance_table(self):
+        """Cumulative comoving distance on a log-spaced (1+z) grid, as a spline"""
+        x = np.linspace(0, np.log1p(self.z_table_max), 4097)  # x = ln(1+z)
+        return CubicSpline(x[::2], distance_integral(x, self.Omega_m, self.Omega_r, self.Omega_Lambda))
+
+    def comoving_distance(self, z):
+        """Line-of-sight comoving distance in Mpc"""
+        z = np.asarray(z, dtype=float)
+        if np.any((z < 0) | (z > self.z_table_max)):
+            raise ValueError(f"Redshift outside the tabulated range 0 <= z <= {self.z_table_max:g}")
+        return self.hubble_distance * self._distance_table(np.log1p(z))
+
+    def transverse_comoving_distance(self, z):
+        """Transverse comoving distance D_M in Mpc (includes curvature)"""
+        chi = self.comoving_distance(z)
+        if self.Omega_k == 0:
+            return chi
+        return transverse_distance(chi, self.hubble_distance, self.Omega_k)
+
+    def angular_diameter_distance(self, z):
+        """D_A = D_M/(1+z) in Mpc"""
+        return self.transverse_comoving_distance(z) / (1 + np.asarray(z, dtype=float))
+
+    def luminosity_distance(self, z):
+        """D_L = (1+z) D_M in Mpc"""
+        return (1 + np.asarray(z, dtype=float)) * self.transverse_comoving_distance(z)
+
+    def growth_factor(self, z):
+        """Approximate growth factor for ΛCDM + wavelength field"""
+        z = np.asarray(z, dtype=float) if not np.isscalar(z) else z
+        a = 1/(1+z)
+
+        # Modified growth due to wavelength field
+        modification = 1 + alpha**2 * np.log(a)  # Logarithmic correction
+
+        # Standard growth factor
+        D_standard = (5*self.Omega_m/2) * self.E(z) * np.sqrt(1+z) / (1+z)**2
+
+        return D_standard * modification
+
+    @cached_property
+    def linear_growth(self):
+        """Tabulated solution of the modified linear growth ODE"""
+        return LinearGrowth(self)
+
+def wavelength_field_mu(a):
+    """Effective coupling G_eff/G = 1 + α² ln a of the wavelength field"""
+    return 1 + alpha**2 * np.log(a)
+
+class LinearGrowth:
+    """
+    Linear growth factor from D'' + (2 + dlnE/dlna) D' = (3/2) Ω_m(a) μ(a) D
+    
+    Primes are d/dln a. The ODE is solved once on a dense ln a grid starting in
+    matter domination (D = D' = a) and D, D' are held in cubic splines, so D(z)
+    and f(z) = dlnD/dlna for whole arrays cost one interpolation.
+    """
+
+    def __init__(self, background, mu=wavelength_field_mu, a_initial=1e-3, n_table=2049):
+        self.background = background
+        self.mu = mu
+        self.a_initial = a_initial
+        self.z_max = 1 / a_initial - 1
+
+        x = np.linspace(np.log(a_initial), 0.0, n_table)
+        sol = solve_ivp(self._equations, (x[0], x[-1]), [a_initial, a_initial], t_eval=x,
+                        method='DOP853', rtol=1e-10, atol=1e-14)
+        if not sol.success:
+            raise RuntimeError(f"Growth integration failed: {sol.message}")
+        D, dD = sol.y
+        self.D0 = D[-1]
+        self._D = CubicSpline(x, D / self.D0)
+        self._f = CubicSpline(x, dD / D)
+
+    def _equations(self, x, y):
+        b = self.background
+        a = np.exp(x)
+        E2_m = b.Omega_m * a**-3
+        E2 = E2_m + b.Omega_r * a**-4 + b.Omega_k * a**-2 + b.Omega_Lambda
+        dlnE = (-3 * E2_m - 4 * b.Omega_r * a**-4 - 2 * b.Omega_k * a**-2) / (2 * E2)
+        D, dD = y
+        return [dD, -(2 + dlnE) * dD + 1.5 * (E2_m / E2) * self.mu(a) * D]
+
+    def _x(self, z):
+        z = np.asarray(z, dtype=float)
+        if np.any((z < 0) | (z > self.z_max)):
+            raise ValueError(f"Redshift outside the tabulated range 0 <= z <= {self.z_max:g}")
+        return -np.log1p(z)
+
+    def D(self, z):
+        """Growth factor normalized to D(z=0) = 1"""
+        return self._D(self._x(z))
+
+    def f(self, z):
+        """Growth rate f = dlnD/dlna"""
+        return self._f(self._x(z))
+
+    def evolve_power(self, P_k, z):
+        """P(k, z) = P(k, 0) D(z)² for arrays of k and z, shape (len(z), len(k))"""
+        return np.asarray(P_k)[np.newaxis, :] * self.D(np.atleast_1d(z))[:, np.newaxis]**2
+
+@lru_cache(maxsize=16)
+def _cached_background(H0, Omega_m, Omega_r, Omega_Lambda):
+    return BackgroundCosmology(H0, Omega_m, Omega_r, Omega_Lambda)
+
+def get_background(H0=FIDUCIAL['H0'], Omega_m=FIDUCIAL['Omega_m'], Omega_r=FIDUCIAL['Omega_r'],
+                   Omega_Lambda=FIDUCIAL['Omega_Lambda']):
+    """Shared background for a parameter set (least recently used sets are evicted)"""
+    return _cached_background(float(H0), float(Omega_m), float(Omega_r), float(Omega_Lambda))
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+BAO Forecast Engine
+===================
+
+Angular and radial BAO scales from the background distances:
+- θ_BAO(z) = r_d / D_M(z) and Δz_BAO(z) = r_d H(z)/c for arbitrary redshift bins
+- Sound horizon r_d from the Aubourg et al. (2015) fit to ω_cb and ω_b
+- Wavelength field shift of the ruler, r_d (1 + α² ln(1+z)), as in the structure formation figure
+- Distances from background_cosmology's E(z), distance integral and curvature
+  mapping, evaluated for every (parameter set, bin) pair at once
+- DESI- and Euclid-like survey configurations with approximate per-bin BAO precisions
+
+Parameter sets are structured arrays (PARAMETER_DTYPE), so a forecast over
+thousands of configurations is one array expression per quantity.
+
+Usage: python src/bao_forecast.py --survey DESI --n-configurations 10000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy import constants
+
+from background_cosmology import FIDUCIAL, curvature, distance_integral, expansion_rate, transverse_distance
+
+# Physical constants
+c = constants.c
+alpha = constants.alpha
+
+PARAMETER_DTYPE = np.dtype([('H0', 'f8'), ('Omega_m', 'f8'), ('Omega_r', 'f8'),
+                            ('Omega_Lambda', 'f8'), ('Omega_b', 'f8'), ('coupling', 'f8')])
+SURVEY_BIN_DTYPE = np.dtype([('z_min', 'f8'), ('z_max', 'f8'), ('sigma_DM', 'f8'), ('sigma_DH', 'f8')])
+SCALE_DTYPE = np.dtype([('z', 'f8'), ('D_M', 'f8'), ('D_H', 'f8'), ('D_V', 'f8'), ('r_d', 'f8'),
+                        ('theta', 'f8'), ('delta_z', 'f8')])
+
+# Approximate fractional precisions on D_M/r_d and D_H/r_d per redshift bin
+SURVEYS = {
+    'DESI': np.array([(0.1, 0.4, 0.015, 0.030), (0.4, 0.6, 0.010, 0.020), (0.6, 0.8, 0.008, 0.015),
+                      (0.8, 1.1, 0.007, 0.012), (1.1, 1.6, 0.009, 0.016), (1.6, 2.1, 0.020, 0.035)],
+                     dtype=SURVEY_BIN_DTYPE),
+    'Euclid': np.array([(0.9, 1.1, 0.007, 0.012), (1.1, 1.3, 0.007, 0.012), (1.3, 1.5, 0.008, 0.013),
+                        (1.5, 1.8, 0.009, 0.015)], dtype=SURVEY_BIN_DTYPE)
+}
+
+MAX_STEP = 0.01  # largest step in x = ln(1+z) of the distance integral
+
+def parameter_sets(H0=FIDUCIAL['H0'], Omega_m=FIDUCIAL['Omega_m'], Omega_r=FIDUCIAL['Omega_r'],
+                   Omega_Lambda=FIDUCIAL['Omega_Lambda'], Omega_b=0.049, coupling=alpha):
+    """Structured array of parameter sets, broadcasting the given columns"""
+    columns = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                    (H0, Omega_m, Omega_r, Omega_Lambda, Omega_b, coupling)))
+    params = np.empty(columns[0].size, dtype=PARAMETER_DTYPE)
+    for name, values in zip(PARAMETER_DTYPE.names, columns):
+        params[name] = values.ravel()
+    return params
+
+def sound_horizon(params):
+    """Drag-epoch sound horizon r_d in Mpc (Aubourg et al. 2015, N_eff = 3.046)"""
+    h2 = (params['H0'] / 100)**2
+    omega_cb = params['Omega_m'] * h2
+    omega_b = params['Omega_b'] * h2
+    return 147.05 * (omega_cb / 0.1432)**-0.23 * (omega_b / 0.02236)**-0.13
+
+def _densities(params):
+    """(Ω_m, Ω_r, Ω_Λ) columns of shape (len(params), 1)"""
+    return tuple(params[name][:, np.newaxis] for name in ('Omega_m', 'Omega_r', 'Omega_Lambda'))
+
+def _hubble_distance(params):
+    """c/H0 in Mpc as a (len(params), 1) column"""
+    return (c / 1000 / params['H0'])[:, np.newaxis]
+
+def _distance_grid(z, max_step=MAX_STEP):
+    """
+    Piecewise uniform x = ln(1+z) grid through every requested redshift
+
+    Each requested x is an even node, so distance_integral returns it exactly
+    at the positions given by the second array.
+    """
+    x_requested = np.log1p(z)
+    x_nodes = np.unique(np.concatenate([[0.0], x_requested]))
+    pieces = [np.zeros(1)]
+    for low, high in zip(x_nodes[:-1], x_nodes[1:]):
+        pairs = max(1, int(np.ceil((high - low) / (2 * max_step))))
+        pieces.append(np.linspace(low, high, 2 * pairs + 1)[1:])
+    x = np.concatenate(pieces)
+    return x, np.searchsorted(x[::2], x_requested)
+
+def comoving_distance(z, params):
+    """Line-of-sight comoving distance in Mpc, shape (len(params), len(z))"""
+    z = np.atleast_1d(np.asarray(z, dtype=float))
+    if np.any(z < 0):
+        raise ValueError("Redshifts must be non-negative")
+    x, index = _distance_grid(z)
+    return _hubble_distance(params) * distance_integral(x, *_densities(params))[:, index]
+
+def transverse_comoving_distance(z, params):
+    """D_M in Mpc, including curvature"""
+    return transverse_distance(comoving_distance(z, params), _hubble_distance(params),
+                               curvature(*_densities(params)))
+
+def wavelength_field_shift(z, coupling=alpha):
+    """Fractional change of the BAO ruler, 1 + α² ln(1+z)"""
+    return 1 + np.asarray(coupling)**2 * np.log(1 + np.asarray(z, dtype=float))
+
+def bao_scales(z, params, modified=True):
+    """
+    BAO distances and scales for every (parameter set, redshift) pair
+
+    Returns a SCALE_DTYPE array of shape (len(params), len(z)); θ is in
+    radians and the wavelength field shift is applied unless modified=False.
+    """
+    params = np.atleast_1d(np.asarray(params, dtype=PARAMETER_DTYPE))
+    z = np.atleast_1d(np.asarray(z, dtype=float))
+    D_M = transverse_comoving_distance(z, params)
+    D_H = _hubble_distance(params) / expansion_rate(z, *_densities(params))
+    r_d = sound_horizon(params)[:, np.newaxis]
+    if modified:
+        r_d = r_d * wavelength_field_shift(z, params['coupling'][:, np.newaxis])
+
+    scales = np.empty(D_M.shape, dtype=SCALE_DTYPE)
+    scales['z'] = z
+    scales['D_M'] = D_M
+    scales['D_H'] = D_H
+    scales['D_V'] = np.cbrt(z * D_M**2 * D_H)
+    scales['r_d'] = r_d
+    scales['theta'] = r_d / D_M
+    scales['delta_z'] = r_d / D_H
+    return scales
+
+def effective_redshifts(survey):
+    """Bin centres of a survey configuration"""
+    return 0.5 * (survey['z_min'] + survey['z_max'])
+
+def forecast(survey, params):
+    """
+    Detection significance of the wavelength field shift for each parameter set
+
+    The fractional shift of D_M/r_d and D_H/r_d in every bin is compared with
+    the survey precisions; returns (shift per bin, combined significance).
+    """
+    survey = SURVEYS[survey] if isinstance(survey, str) else np.asarray(survey, dtype=SURVEY_BIN_DTYPE)
+    params = np.atleast_1d(np.asarray(params, dtype=PARAMETER_DTYPE))
+    z = effective_redshifts(survey)
+    shift = wavelength_field_shift(z, params['coupling'][:, np.newaxis]) - 1
+    chi2 = np.sum(shift**2 * (survey['sigma_DM']**-2 + survey['sigma_DH']**-2), axis=-1)
+    return shift, np.sqrt(chi2)
+
+def main(argv=None):
+    """Forecast BAO scales and wavelength field significance for a survey"""
+    parser = argparse.ArgumentParser(description="BAO forecasts for wavelength field theory")
+    parser.add_argument('--survey', default='DESI', choices=sorted(SURVEYS))
+    parser.add_argument('--n-configurations', type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    survey = SURVEYS[args.survey]
+    rng = np.random.default_rng(0)
+    n = args.n_configurations
+    Omega_m = rng.uniform(0.27, 0.35, n)
+    params = parameter_sets(H0=rng.uniform(64, 76, n), Omega_m=Omega_m, Omega_Lambda=1 - Omega_m,
+                            coupling=alpha * np.logspace(0, 2, n))
+    z = effective_redshifts(survey)
+
+    start = time.perf_counter()
+    scales = bao_scales(z, params)
+    shift, significance = forecast(survey, params)
+    elapsed = time.perf_counter() - start
+
+    fiducial = bao_scales(z, parameter_sets())[0]
+    print(f"BAO FORECAST - {args.survey}")
+    print("=" * 60)
+    print(f"{'z_eff':>6} {'D_M [Mpc]':>11} {'D_H [Mpc]':>11} {'θ_BAO [deg]':>12} {'Δz_BAO':>9}")
+    for row in fiducial:
+        print(f"{row['z']:6.2f} {row['D_M']:11.1f} {row['D_H']:11.1f} {np.degrees(row['theta']):12.4f} "
+              f"{row['delta_z']:9.4f}")
+    print(f"✅ {scales.size} (configuration, bin) scales in {elapsed * 1000:.1f} ms")
+    print(f"• Fiducial α: significance {forecast(survey, parameter_sets())[1][0]:.2e} σ")
+    detectable = significance >= 5
+    if detectable.any():
+        print(f"• 5σ detection needs α ≳ {params['coupling'][detectable].min() / alpha:.1f} × α_fine")
+    else:
+        print("• No configuration reaches 5σ")
+    return scales, significance
+
+if __name__ == "__main__":
+    main()
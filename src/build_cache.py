@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Incremental Build Cache
+=======================
+
+Content-hashed dependency graph for the analysis scripts:
+- Each script is a node that produces known output files (figures/*.png, results/*.csv)
+- A node key hashes the script source, the local modules it imports, its input
+  data files, its parameters and the versions of the numerical libraries
+- Outputs of every successful run are stored under .wft_cache/<key>/
+- Nodes whose outputs already match their key are skipped; nodes with a cached
+  key are restored by copying; only stale nodes have to be re-run
+- A verification key over all sources and library versions records a fully
+  passed verification, so no-op runs can skip the slow environment checks
+- ArrayCache keeps computed arrays as .npy files under .wft_cache/<subdir>/,
+  keyed by parameters and input grids, least recently used first out past a size limit
+
+Usage: python src/build_cache.py [--force]   (prints the build plan)
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import sys
+from importlib import metadata
+
+import numpy as np
+
+CACHE_DIR = '.wft_cache'
+MANIFEST_FILE = 'manifest.json'
+VERIFIED_DIR = 'verified'
+CACHE_VERSION = 1
+ARRAY_CACHE_LIMIT_MB = 1024  # per ArrayCache directory
+
+# Libraries whose version changes can change numbers or rendered figures
+TRACKED_PACKAGES = ['numpy', 'scipy', 'matplotlib', 'sympy', 'pandas']
+
+# Node states in a build plan
+CURRENT, RESTORED, STALE = 'current', 'restored', 'stale'
+
+def file_digest(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def library_versions(packages=TRACKED_PACKAGES):
+    """Installed versions of the tracked libraries and of Python itself"""
+    versions = {'python': '.'.join(map(str, sys.version_info[:3]))}
+    for package in packages:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+def local_dependencies(script):
+    """Modules next to a script that it imports, followed transitively"""
+    source_dir = os.path.dirname(script)
+    pending, found = [script], []
+    while pending:
+        with open(pending.pop()) as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                path = os.path.join(source_dir, name.split('.')[0] + '.py')
+                if os.path.exists(path) and path != script and path not in found:
+                    found.append(path)
+                    pending.append(path)
+    return sorted(found)
+
+class BuildNode:
+    """One script together with the files it reads and writes"""
+
+    def __init__(self, script, outputs, inputs=(), args=()):
+        self.script = script
+        self.outputs = list(outputs)
+        self.inputs = list(inputs)
+        self.args = list(args)
+
+    @property
+    def name(self):
+        return os.path.splitext(os.path.basename(self.script))[0]
+
+    def key(self, versions=None):
+        """Content hash of everything that determines this node's outputs"""
+        sources = [self.script] + local_dependencies(self.script)
+        description = {
+            'cache_version': CACHE_VERSION,
+            'script': self.script,
+            'sources': {path: file_digest(path) for path in sources},
+            'inputs': {path: file_digest(path) for path in self.inputs},
+            'outputs': self.outputs,
+            'args': self.args,
+            'libraries': versions or library_versions()
+        }
+        encoded = json.dumps(description, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+def verification_key(sources, versions=None):
+    """Content hash of the sources and libraries a verification pass checked"""
+    description = {
+        'cache_version': CACHE_VERSION,
+        'sources': {path: file_digest(path) for path in sorted(sources)},
+        'libraries': versions or library_versions()
+    }
+    encoded = json.dumps(description, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+# Script -> outputs graph; the scripts write disjoint files
+BUILD_GRAPH = [
+    BuildNode('src/wavelength_field_validation.py',
+              outputs=['results/complete_30_test_validation_results.csv'],
+              inputs=['data/validation_test_catalogue.csv']),
+    BuildNode('src/theoretical_foundations.py',
+              outputs=['figures/detailed_cosmological_predictions.png']),
+    BuildNode('src/comprehensive_critique_solutions.py',
+              outputs=['figures/generalized_em_fractions.png',
+                       'figures/complete_cosmological_evolution.png',
+                       'figures/comprehensive_theoretical_diagrams.png']),
+    BuildNode('src/fundamental_derivations_response.py',
+              outputs=['figures/parameter_constraints_comprehensive.png']),
+    BuildNode('src/enhanced_manuscript_improvements.py',
+              outputs=['figures/enhanced_manuscript_analysis.png'])
+]
+
+class BuildCache:
+    """Directory of cached node outputs, one subdirectory per node key"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _entry(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def manifest(self, key):
+        """Stored manifest for a key, or None when it has not been built"""
+        path = os.path.join(self._entry(key), MANIFEST_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def is_current(self, node, key):
+        """True when the working tree outputs are exactly the cached ones"""
+        manifest = self.manifest(key)
+        if manifest is None:
+            return False
+        for output, digest in manifest['outputs'].items():
+            if not os.path.exists(output) or file_digest(output) != digest:
+                return False
+        return True
+
+    def restore(self, node, key):
+        """Copy a node's cached outputs back into the working tree"""
+        manifest = self.manifest(key)
+        for output, digest in manifest['outputs'].items():
+            os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+            shutil.copyfile(os.path.join(self._entry(key), digest), output)
+
+    def store(self, node, key):
+        """Cache the outputs just produced by a successful run of a node"""
+        missing = [output for output in node.outputs if not os.path.exists(output)]
+        if missing:
+            raise FileNotFoundError(f"{node.script} did not produce {', '.join(missing)}")
+
+        staging = self._entry(key) + '.tmp'
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        outputs = {}
+        for output in node.outputs:
+            digest = file_digest(output)
+            shutil.copyfile(output, os.path.join(staging, digest))
+            outputs[output] = digest
+        with open(os.path.join(staging, MANIFEST_FILE), 'w') as f:
+            json.dump({'script': node.script, 'key': key, 'outputs': outputs}, f, indent=2)
+
+        shutil.rmtree(self._entry(key), ignore_errors=True)
+        os.replace(staging, self._entry(key))
+
+    def is_verified(self, key):
+        """True when a verification pass has succeeded for this verification key"""
+        return os.path.exists(os.path.join(self.cache_dir, VERIFIED_DIR, key))
+
+    def mark_verified(self, key):
+        """Record a successful verification pass for a verification key"""
+        os.makedirs(os.path.join(self.cache_dir, VERIFIED_DIR), exist_ok=True)
+        open(os.path.join(self.cache_dir, VERIFIED_DIR, key), 'w').close()
+
+class ArrayCache:
+    """Computed arrays stored as .npy files in CACHE_DIR/<subdir>, one file per key"""
+
+    def __init__(self, subdir, version, root=CACHE_DIR, max_mb=ARRAY_CACHE_LIMIT_MB):
+        self.directory = os.path.join(root, subdir)
+        self.version = version
+        self.max_bytes = int(max_mb * 1e6)
+
+    def __repr__(self):
+        return f"ArrayCache({self.directory!r}, version={self.version})"
+
+    def key(self, parameters, *arrays):
+        """SHA-256 of the cache version, a JSON-serializable parameter dict and the input arrays"""
+        description = {'version': self.version, 'parameters': parameters}
+        digest = hashlib.sha256(json.dumps(description, sort_keys=True).encode('utf-8'))
+        for array in arrays:
+            array = np.ascontiguousarray(array, dtype=np.float64)
+            digest.update(str(array.shape).encode('utf-8'))
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def load(self, compute, parameters, *arrays):
+        """
+        Read-only memory map of the cached array for a key, calling compute() on a miss
+
+        New entries are written to a per-process temporary file and renamed into
+        place, so concurrent writers never expose a partial file. Hits refresh the
+        entry's modification time, which orders the eviction in prune().
+        """
+        path = os.path.join(self.directory, self.key(parameters, *arrays) + '.npy')
+        if os.path.exists(path):
+            os.utime(path)
+        else:
+            array = compute()
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp, path)
+            self.prune(keep=path)
+        return np.load(path, mmap_mode='r')
+
+    def entries(self):
+        """(path, bytes, mtime) of every cached array, least recently used first"""
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npy'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:  # removed by another process
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size(self):
+        """Total bytes of the cached arrays"""
+        return sum(size for _, size, _ in self.entries())
+
+    def prune(self, max_bytes=None, keep=None):
+        """Delete least recently used arrays until the cache fits in max_bytes; returns the count"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in entries:
+            if total <= max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)  # open memory maps stay valid on POSIX
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Delete every cached array"""
+        return self.prune(max_bytes=0)
+
+def plan_build(nodes=BUILD_GRAPH, cache=None, force=False):
+    """
+    Classify nodes as current, restorable from cache or stale
+
+    Returns a list of (node, key, state) in graph order.
+    """
+    cache = cache or BuildCache()
+    versions = library_versions()
+    plan = []
+    for node in nodes:
+        key = node.key(versions)
+        if force or cache.manifest(key) is None:
+            state = STALE
+        elif cache.is_current(node, key):
+            state = CURRENT
+        else:
+            state = RESTORED
+        plan.append((node, key, state))
+    return plan
+
+def print_build_plan(plan):
+    """Print the state of every node in a build plan"""
+    symbols = {CURRENT: '✅', RESTORED: '♻️ ', STALE: '🔨'}
+    print("\n📦 BUILD PLAN")
+    print("-" * 60)
+    for node, key, state in plan:
+        print(f"{symbols[state]} {node.script:<45} {state:<9} {key[:12]}")
+
+def main(argv=None):
+    """Print the build plan for the current tree"""
+    argv = sys.argv[1:] if argv is None else argv
+    print_build_plan(plan_build(force='--force' in argv))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
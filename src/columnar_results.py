@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Binary Columnar Result Store
+============================
+
+Memory-mappable alternative to the text CSVs in results/:
+- One raw little-endian file per column, opened with np.memmap (zero copy)
+- Variable-length string columns as Arrow-style offsets + UTF-8 data
+- schema.json header with column names, dtypes and row count
+- Append-only writer so streamed results can be written chunk by chunk
+
+A store for results/foo.csv lives next to it as results/foo.cols/.
+
+Usage: python src/columnar_results.py results/*.csv
+"""
+
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+
+FORMAT_NAME = 'wft-columnar'
+FORMAT_VERSION = 1
+STORE_SUFFIX = '.cols'
+SCHEMA_FILE = 'schema.json'
+
+# Column kinds: fixed-width numeric columns or variable-length UTF-8 strings
+STRING = 'str'
+NUMERIC_DTYPES = {'<f8', '<i8', '|b1'}
+
+def store_path_for(csv_path):
+    """Columnar store path that sits next to a results CSV"""
+    return os.path.splitext(csv_path)[0] + STORE_SUFFIX
+
+def _column_kind(values):
+    """Schema dtype for a column of values"""
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        return '<f8'
+    if values.dtype.kind in 'iu':
+        return '<i8'
+    if values.dtype.kind == 'b':
+        return '|b1'
+    return STRING
+
+def _column_files(path, name, kind):
+    """Data file(s) of one column inside a store"""
+    if kind == STRING:
+        return os.path.join(path, f"{name}.offsets"), os.path.join(path, f"{name}.data")
+    return os.path.join(path, f"{name}.bin"), None
+
+class ColumnarWriter:
+    """
+    Append-only writer for a columnar store
+
+    Columns are fixed by the first append (or the schema argument); every
+    append must provide all of them with equal lengths. The schema header is
+    written on close, so a store is only readable once it is complete.
+    """
+
+    def __init__(self, path, schema=None):
+        self.path = path
+        self.schema = dict(schema) if schema else None
+        self.rows = 0
+        self._files = {}
+        self._string_bytes = {}
+        os.makedirs(path, exist_ok=True)
+        # A stale header must not describe the columns being rewritten
+        if os.path.exists(os.path.join(path, SCHEMA_FILE)):
+            os.remove(os.path.join(path, SCHEMA_FILE))
+
+    def _open(self, columns):
+        if self.schema is None:
+            self.schema = {name: _column_kind(values) for name, values in columns.items()}
+        for name, kind in self.schema.items():
+            data_file, string_file = _column_files(self.path, name, kind)
+            self._files[name] = [open(data_file, 'wb')]
+            if kind == STRING:
+                self._files[name].append(open(string_file, 'wb'))
+                self._string_bytes[name] = 0
+                np.zeros(1, dtype='<i8').tofile(self._files[name][0])
+
+    def append(self, columns):
+        """Append one chunk given as {column name: values}"""
+        if not self._files:
+            self._open(columns)
+        if set(columns) != set(self.schema):
+            raise ValueError(f"Chunk columns {sorted(columns)} do not match schema {sorted(self.schema)}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns in a chunk must have the same length")
+
+        for name, kind in self.schema.items():
+            values = columns[name]
+            if kind == STRING:
+                encoded = [str(value).encode('utf-8') for value in values]
+                offsets = self._string_bytes[name] + np.cumsum([len(b) for b in encoded], dtype='<i8')
+                offsets.tofile(self._files[name][0])
+                self._files[name][1].write(b''.join(encoded))
+                if len(offsets):
+                    self._string_bytes[name] = int(offsets[-1])
+            else:
+                np.ascontiguousarray(values, dtype=kind).tofile(self._files[name][0])
+        self.rows += lengths.pop() if lengths else 0
+        return self
+
+    def _close_files(self):
+        for handles in self._files.values():
+            for handle in handles:
+                handle.close()
+
+    def close(self):
+        """Flush the column files and write the schema header"""
+        self._close_files()
+        header = {
+            'format': FORMAT_NAME,
+            'version': FORMAT_VERSION,
+            'rows': self.rows,
+            'columns': [{'name': name, 'dtype': kind} for name, kind in (self.schema or {}).items()]
+        }
+        with open(os.path.join(self.path, SCHEMA_FILE), 'w') as f:
+            json.dump(header, f, indent=2)
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # A store abandoned by an exception stays headerless, so it is never read
+        if exc_info[0] is not None:
+            self._close_files()
+        else:
+            self.close()
+
+class StringColumn:
+    """Memory-mapped UTF-8 string column, decoded on access"""
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string column index out of range")
+        return bytes(self.data[self.offsets[index]:self.offsets[index + 1]]).decode('utf-8')
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def tolist(self):
+        return list(self)
+
+    def to_numpy(self):
+        return np.array(self.tolist(), dtype=str)
+
+class ColumnarTable:
+    """Read-only view of a columnar store: columns are memory-mapped on first access"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, SCHEMA_FILE)) as f:
+            header = json.load(f)
+        if header.get('format') != FORMAT_NAME:
+            raise ValueError(f"{path} is not a {FORMAT_NAME} store")
+        if header.get('version', 0) > FORMAT_VERSION:
+            raise ValueError(f"{path} uses format version {header['version']} (supported: {FORMAT_VERSION})")
+        self.rows = header['rows']
+        self.schema = {column['name']: column['dtype'] for column in header['columns']}
+        self._columns = {}
+
+    @property
+    def columns(self):
+        return list(self.schema)
+
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, name):
+        return name in self.schema
+
+    def __getitem__(self, name):
+        if name not in self._columns:
+            self._columns[name] = self._map(name, self.schema[name])
+        return self._columns[name]
+
+    def _map(self, name, kind):
+        data_file, string_file = _column_files(self.path, name, kind)
+        if kind == STRING:
+            offsets = _memmap(data_file, '<i8', self.rows + 1)
+            data = _memmap(string_file, 'u1', int(offsets[-1]))
+            return StringColumn(offsets, data)
+        return _memmap(data_file, kind, self.rows)
+
+    def to_dict(self):
+        """All columns as in-memory arrays"""
+        return {name: (self[name].to_numpy() if kind == STRING else np.array(self[name]))
+                for name, kind in self.schema.items()}
+
+def _memmap(path, dtype, length):
+    """Read-only memory map (np.memmap cannot map empty files)"""
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(length,))
+
+def write_columnar(path, columns):
+    """Write {column name: values} as a columnar store"""
+    with ColumnarWriter(path) as writer:
+        writer.append(columns)
+    return path
+
+def read_columnar(path):
+    """Open a columnar store"""
+    return ColumnarTable(path)
+
+def _parse_csv_column(values):
+    """Numeric array when every entry parses as a float, otherwise strings"""
+    try:
+        return np.array([float(value) for value in values], dtype=np.float64)
+    except ValueError:
+        return np.array(values, dtype=str)
+
+def csv_to_columnar(csv_path, path=None):
+    """Convert a results CSV into a columnar store next to it"""
+    path = path or store_path_for(csv_path)
+    with open(csv_path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = [row for row in reader if row]
+    columns = list(zip(*rows)) or [()] * len(header)
+    return write_columnar(path, {name: _parse_csv_column(values) for name, values in zip(header, columns)})
+
+def open_results(csv_path):
+    """
+    Open a results table, preferring its columnar store when it is up to date
+
+    Returns a ColumnarTable when results/<name>.cols exists and is at least as
+    new as the CSV (or the CSV is absent), otherwise None.
+    """
+    path = store_path_for(csv_path)
+    schema_file = os.path.join(path, SCHEMA_FILE)
+    if not os.path.exists(schema_file):
+        return None
+    if os.path.exists(csv_path) and os.path.getmtime(schema_file) < os.path.getmtime(csv_path):
+        return None
+    return ColumnarTable(path)
+
+def main(argv=None):
+    """Convert the given results CSVs to columnar stores"""
+    csv_paths = sys.argv[1:] if argv is None else argv
+    if not csv_paths:
+        print(__doc__.strip().splitlines()[-1])
+        return 1
+    for csv_path in csv_paths:
+        path = csv_to_columnar(csv_path)
+        table = read_columnar(path)
+        print(f"✅ {csv_path} → {path} ({len(table)} rows, {len(table.columns)} columns)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
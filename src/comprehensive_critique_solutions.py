@@ -18,9 +18,12 @@ Date: 20 July 2025
 import numpy as np
 import sympy as sp
 from scipy import constants
-from scipy.integrate import odeint, solve_ivp
+from scipy.integrate import odeint, solve_ivp, BDF, LSODA, Radau, RK45
 import matplotlib.pyplot as plt
 
+from background_cosmology import get_background
+from instrumentation import instrument, instrument_class
+
 # Physical constants
 c = constants.c
 h = constants.h
@@ -32,11 +35,136 @@ k_B = constants.k
 m_e = constants.m_e
 m_p = constants.m_p
 
-print("COMPREHENSIVE CRITIQUE SOLUTIONS")
-print("=" * 50)
-print("Addressing All Critical Theory Challenges")
-print("=" * 50)
+# Background cosmology and wavelength field parameters of the evolution solve
+COSMOLOGY_PARAMS = {
+    'H0': 70,  # km/s/Mpc
+    'Omega_m0': 0.31,
+    'Omega_r0': 5e-5,
+    'Omega_Lambda0': 0.69,
+    'm_phi': 1e-33 * constants.eV / (hbar * c),  # Very light field
+    'lambda_phi': 1e-10,  # Self-coupling
+    'phi_0': 1e-3  # Initial field value (Planck units)
+}
+
+def cosmology_args(params):
+    """
+    solve_ivp args of cosmological_equations for a parameter set
+
+    The background is resolved once per solve, so the RHS receives the
+    physical densities Ω h² instead of looking them up on every call.
+    """
+    background = get_background(params['H0'], params['Omega_m0'], params['Omega_r0'], params['Omega_Lambda0'])
+    return background.physical_densities + (params['m_phi'], params['lambda_phi'])
+
+def field_density_pressure(phi, phi_dot, m_phi, lambda_phi):
+    """Wavelength field ρ_φ and P_φ for V(φ) = m²φ²/2 + λφ⁴/24"""
+    kinetic = 0.5 * phi_dot**2
+    potential = 0.5 * m_phi**2 * phi**2 + lambda_phi * phi**4 / 24
+    return kinetic + potential, kinetic - potential
+
+def cosmological_equations(t, y, omega_m, omega_r, omega_Lambda, m_phi, lambda_phi):
+    """
+    Solve coupled cosmological evolution
+    y = [a, a_dot, phi, phi_dot], densities ω = Ω h² (see cosmology_args)
+    """
+    a, a_dot, phi, phi_dot = y
+    
+    # Hubble parameter
+    H = a_dot / a
+    
+    # Energy densities (in units where c = 1)
+    rho_m = omega_m / a**3
+    rho_r = omega_r / a**4
+    rho_Lambda = omega_Lambda
+    
+    # Wavelength field energy density
+    rho_phi, P_phi = field_density_pressure(phi, phi_dot, m_phi, lambda_phi)
+    
+    # Total energy density and pressure
+    rho_total = rho_m + rho_r + rho_phi + rho_Lambda
+    P_total = rho_r/3 + P_phi - rho_Lambda
+    
+    # Friedmann equations
+    H_new = np.sqrt(8 * np.pi * G * rho_total / 3)
+    a_ddot = -4 * np.pi * G * a * (rho_total + 3 * P_total) / 3
+    
+    # Field equation
+    phi_ddot = -3 * H * phi_dot - m_phi**2 * phi - lambda_phi * phi**3 / 6
+    
+    return [a_dot, a_ddot, phi_dot, phi_ddot]
+
+def cosmological_jacobian(t, y, omega_m, omega_r, omega_Lambda, m_phi, lambda_phi):
+    """
+    Analytic Jacobian d(y_dot)/dy of cosmological_equations
+    
+    With S = ρ_total + 3P_total = ρ_m + 2ρ_r + 2φ̇² - m²φ² - λφ⁴/12 - 2ρ_Λ
+    the acceleration is ä = -(4πG/3) a S, and ρ_m ∝ a⁻³, ρ_r ∝ a⁻⁴.
+    """
+    a, a_dot, phi, phi_dot = y
+    
+    rho_m = omega_m / a**3
+    rho_r = omega_r / a**4
+    rho_Lambda = omega_Lambda
+    S = (rho_m + 2 * rho_r + 2 * phi_dot**2 - m_phi**2 * phi**2
+         - lambda_phi * phi**4 / 12 - 2 * rho_Lambda)
+    k = 4 * np.pi * G / 3
+    
+    return np.array([
+        [0.0, 1.0, 0.0, 0.0],
+        [-k * (S - 3 * rho_m - 8 * rho_r), 0.0,
+         -k * a * (-2 * m_phi**2 * phi - lambda_phi * phi**3 / 3), -k * a * 4 * phi_dot],
+        [0.0, 0.0, 0.0, 1.0],
+        [3 * a_dot * phi_dot / a**2, -3 * phi_dot / a,
+         -m_phi**2 - lambda_phi * phi**2 / 2, -3 * a_dot / a]
+    ])
 
+# Integrators for the evolution solve; the implicit ones use the analytic Jacobian.
+# LSODA switches automatically between non-stiff (Adams) and stiff (BDF) steps.
+COSMOLOGY_SOLVERS = {'RK45': RK45, 'LSODA': LSODA, 'Radau': Radau, 'BDF': BDF}
+JACOBIAN_SOLVERS = {'LSODA', 'Radau', 'BDF'}
+
+def _step_counting(solver_class, counts):
+    """Subclass of an ODE solver that counts its accepted steps"""
+    class StepCountingSolver(solver_class):
+        def step(self):
+            message = super().step()
+            if self.status != 'failed':
+                counts['steps'] += 1
+            return message
+    StepCountingSolver.__name__ = solver_class.__name__
+    return StepCountingSolver
+
+def cosmology_initial_state(params=COSMOLOGY_PARAMS, a_initial=0.01):
+    """Radiation-dominated initial state [a, a_dot, phi, phi_dot]"""
+    H_initial = params['H0'] * np.sqrt(params['Omega_r0']) / a_initial**2
+    return [a_initial, a_initial * H_initial, params['phi_0'], 0]
+
+def integrate_cosmology(params=None, t_span=(0.01, 1.0), t_eval=None, method='RK45', rtol=1e-8,
+                        atol=1e-6, a_initial=0.01):
+    """
+    Integrate the coupled Friedmann-field equations (time in units of 1/H0)
+    
+    method is one of COSMOLOGY_SOLVERS; LSODA, Radau and BDF are given the
+    analytic Jacobian. The returned solution carries solver statistics in
+    sol.stats (accepted steps, RHS and Jacobian evaluations, LU decompositions).
+    """
+    if method not in COSMOLOGY_SOLVERS:
+        raise ValueError(f"Unknown method '{method}' (choose from {', '.join(COSMOLOGY_SOLVERS)})")
+    params = dict(COSMOLOGY_PARAMS, **(params or {}))
+    if t_eval is None:
+        t_eval = np.logspace(-2, 0, 1000)
+    args = cosmology_args(params)
+    options = {'jac': cosmological_jacobian} if method in JACOBIAN_SOLVERS else {}
+    
+    counts = {'steps': 0}
+    sol = solve_ivp(cosmological_equations, t_span, cosmology_initial_state(params, a_initial),
+                    t_eval=t_eval, method=_step_counting(COSMOLOGY_SOLVERS[method], counts),
+                    rtol=rtol, atol=atol, args=args, **options)
+    sol.stats = {'method': method, 'steps': counts['steps'], 'nfev': sol.nfev,
+                 'njev': sol.njev, 'nlu': sol.nlu}
+    return sol
+
+@instrument_class
 class ComprehensiveCritiqueSolutions:
     """
     Complete solutions to all major theoretical challenges
@@ -523,7 +651,7 @@ class ComprehensiveCritiqueSolutions:
         
         return materials
     
-    def complete_cosmological_evolution(self):
+    def complete_cosmological_evolution(self, method='RK45'):
         """Solve complete cosmological evolution with wavelength field"""
         print("\n🔴 CHALLENGE 5: COMPLETE COSMOLOGICAL EVOLUTION")
         print("-" * 60)
@@ -546,86 +674,41 @@ class ComprehensiveCritiqueSolutions:
         print("For potential V(φ) = (1/2)m_φ²φ² + (λ/4!)φ⁴")
         print()
         
-        # Define cosmological parameters
-        H0 = 70  # km/s/Mpc
-        Omega_m0 = 0.31
-        Omega_r0 = 5e-5
-        Omega_Lambda0 = 0.69
+        # Define cosmological and wavelength field parameters
+        H0 = COSMOLOGY_PARAMS['H0']
+        Omega_m0 = COSMOLOGY_PARAMS['Omega_m0']
+        m_phi = COSMOLOGY_PARAMS['m_phi']
+        lambda_phi = COSMOLOGY_PARAMS['lambda_phi']
+        phi_0 = COSMOLOGY_PARAMS['phi_0']
         
-        # Wavelength field parameters
-        m_phi = 1e-33 * constants.eV / (hbar * c)  # Very light field
-        lambda_phi = 1e-10  # Self-coupling
-        phi_0 = 1e-3  # Initial field value (Planck units)
-        
-        def cosmological_equations(t, y):
-            """
-            Solve coupled cosmological evolution
-            y = [a, a_dot, phi, phi_dot]
-            """
-            a, a_dot, phi, phi_dot = y
-            
-            # Hubble parameter
-            H = a_dot / a
-            
-            # Energy densities (in units where c = 1)
-            rho_m = Omega_m0 * (H0/100)**2 / a**3
-            rho_r = Omega_r0 * (H0/100)**2 / a**4
-            rho_Lambda = Omega_Lambda0 * (H0/100)**2
-            
-            # Wavelength field energy density
-            rho_phi = 0.5 * phi_dot**2 + 0.5 * m_phi**2 * phi**2 + lambda_phi * phi**4 / 24
-            P_phi = 0.5 * phi_dot**2 - 0.5 * m_phi**2 * phi**2 - lambda_phi * phi**4 / 24
-            
-            # Total energy density and pressure
-            rho_total = rho_m + rho_r + rho_phi + rho_Lambda
-            P_total = rho_r/3 + P_phi - rho_Lambda
-            
-            # Friedmann equations
-            H_new = np.sqrt(8 * np.pi * G * rho_total / 3)
-            a_ddot = -4 * np.pi * G * a * (rho_total + 3 * P_total) / 3
-            
-            # Field equation
-            phi_ddot = -3 * H * phi_dot - m_phi**2 * phi - lambda_phi * phi**3 / 6
-            
-            return [a_dot, a_ddot, phi_dot, phi_ddot]
-        
-        # Time range (in units of 1/H0)
-        t_span = (0.01, 1.0)  # From early universe to today
+        # Time range (in units of 1/H0): from early universe to today
         t_eval = np.logspace(-2, 0, 1000)
         
-        # Initial conditions
-        a_initial = 0.01  # Early universe
-        H_initial = H0 * np.sqrt(Omega_r0) / a_initial**2  # Radiation dominated
-        phi_initial = phi_0
-        phi_dot_initial = 0
-        
-        y0 = [a_initial, a_initial * H_initial, phi_initial, phi_dot_initial]
-        
         # Solve the system
         print("3. NUMERICAL SOLUTION:")
         print("Solving coupled Friedmann-field equations...")
         
         try:
-            sol = solve_ivp(cosmological_equations, t_span, y0, t_eval=t_eval, 
-                          method='RK45', rtol=1e-8)
+            sol = integrate_cosmology(t_eval=t_eval, method=method)
             
             a_t = sol.y[0]
             phi_t = sol.y[2]
             phi_dot_t = sol.y[3]
             
             # Calculate derived quantities
-            H_t = np.gradient(a_t, sol.t) / a_t
+            H_t = sol.y[1] / a_t  # ȧ/a from the state, no finite differences
             
             # Energy densities
-            rho_phi_t = 0.5 * phi_dot_t**2 + 0.5 * m_phi**2 * phi_t**2 + lambda_phi * phi_t**4 / 24
+            rho_phi_t, P_phi_t = field_density_pressure(phi_t, phi_dot_t, m_phi, lambda_phi)
             rho_m_t = Omega_m0 * (H0/100)**2 / a_t**3
             rho_total_t = rho_m_t + rho_phi_t
             
             # Equation of state
-            P_phi_t = 0.5 * phi_dot_t**2 - 0.5 * m_phi**2 * phi_t**2 - lambda_phi * phi_t**4 / 24
             w_phi_t = P_phi_t / rho_phi_t
             
             print("✅ Numerical solution completed successfully")
+            print(f"   {sol.stats['method']}: {sol.stats['steps']} steps, {sol.stats['nfev']} RHS evaluations, "
+                  f"{sol.stats['njev']} Jacobian evaluations")
             
         except Exception as e:
             print(f"❌ Numerical solution failed: {e}")
@@ -700,6 +783,7 @@ class ComprehensiveCritiqueSolutions:
             'energy_fraction': rho_phi_t[-1]/rho_total_t[-1]
         }
 
+@instrument
 def create_comprehensive_diagrams():
     """Create comprehensive theoretical diagrams"""
     print("\n🟢 ADDITIONAL COMPREHENSIVE DIAGRAMS")
@@ -710,7 +794,7 @@ def create_comprehensive_diagrams():
     m_phi = 1e-3
     lambda_phi = 1e-4
     
-    V_phi = 0.5 * m_phi**2 * phi**2 + lambda_phi * phi**4 / 24
+    V_phi, _ = field_density_pressure(phi, 0.0, m_phi, lambda_phi)  # ρ_φ of a field at rest
     
     plt.figure(figsize=(14, 10))
     
@@ -797,6 +881,10 @@ def create_comprehensive_diagrams():
 
 def main():
     """Address all comprehensive critiques"""
+    print("COMPREHENSIVE CRITIQUE SOLUTIONS")
+    print("=" * 50)
+    print("Addressing All Critical Theory Challenges")
+    print("=" * 50)
     
     solutions = ComprehensiveCritiqueSolutions()
     
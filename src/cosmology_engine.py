@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Redshift-Parameterized Cosmology Engine
+=======================================
+
+Integrates the Friedmann-field equations in x = ln a instead of time:
+- State [φ, φ̇, t, η] evolved from a_initial to today (a = 1)
+- H(a) from the Friedmann constraint H² = H0² (E²_background + ρ_φ/h²), with E(z)
+  of the shared background_cosmology; the field obeys the φ equation of
+  cosmological_equations. Times are in units of 1/(km/s/Mpc), as in the
+  initial state, so H(z) is in km/s/Mpc and H(z=0) = H0
+- The solver's dense output is kept, so any redshift is answered by interpolation
+- H(z), w_φ(z) and Ω_φ(z) come from the interpolated state (no np.gradient)
+- Conformal time η gives comoving, luminosity and angular diameter distances, with
+  the curvature Ω_k of the shared background applied as in background_cosmology
+
+Each query locates its step by binary search in the dense output (O(log n));
+engines are cached per parameter set, so repeated queries never re-integrate.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from scipy import constants
+from scipy.integrate import solve_ivp
+
+from background_cosmology import get_background, transverse_distance
+from comprehensive_critique_solutions import (COSMOLOGY_PARAMS, cosmological_equations, cosmology_args,
+                                              cosmology_initial_state, field_density_pressure)
+
+# Physical constants
+c = constants.c
+
+class CosmologyEngine:
+    """Background evolution of one wavelength field cosmology, queried by redshift"""
+
+    def __init__(self, params=None, a_initial=0.01, method='DOP853', rtol=1e-10, atol=1e-12):
+        self.params = dict(COSMOLOGY_PARAMS, **(params or {}))
+        self.a_initial = a_initial
+        self.z_max = 1 / a_initial - 1
+        self._args = cosmology_args(self.params)
+
+        self.background = get_background(self.params['H0'], self.params['Omega_m0'],
+                                         self.params['Omega_r0'], self.params['Omega_Lambda0'])
+        self._h2 = (self.params['H0']/100)**2
+
+        _, _, phi0, phi_dot0 = cosmology_initial_state(self.params, a_initial)
+        # t and η are measured from the initial time
+        y0 = [phi0, phi_dot0, 0.0, 0.0]
+        self.solution = solve_ivp(self._equations, (np.log(a_initial), 0.0), y0, method=method,
+                                  rtol=rtol, atol=atol, dense_output=True)
+        if not self.solution.success:
+            raise RuntimeError(f"Cosmology integration failed: {self.solution.message}")
+        self._eta_today = self.solution.y[3, -1]
+
+    def _expansion_rate(self, a, phi, phi_dot):
+        """H = H0 √(E²(z) + ρ_φ/h²) in km/s/Mpc (densities in Ω h² units)"""
+        m_phi, lambda_phi = self.params['m_phi'], self.params['lambda_phi']
+        rho_phi, _ = field_density_pressure(phi, phi_dot, m_phi, lambda_phi)
+        return self.params['H0'] * np.sqrt(self.background.E(1 / a - 1)**2 + rho_phi / self._h2)
+
+    def _equations(self, x, y):
+        """d/d(ln a) of [φ, φ̇, t, η]"""
+        a = np.exp(x)
+        phi, phi_dot, t, eta = y
+        H = self._expansion_rate(a, phi, phi_dot)
+        phi_ddot = cosmological_equations(t, [a, a * H, phi, phi_dot], *self._args)[3]
+        return [phi_dot / H, phi_ddot / H, 1 / H, 1 / (a * H)]
+
+    def state(self, z):
+        """Interpolated (a, ȧ, φ, φ̇, t, η) at redshift(s) z"""
+        z = np.asarray(z, dtype=float)
+        if np.any((z < 0) | (z > self.z_max)):
+            raise ValueError(f"Redshift outside the integrated range 0 <= z <= {self.z_max:g}")
+        x = -np.log1p(z)
+        a = np.exp(x)
+        phi, phi_dot, t, eta = self.solution.sol(x.ravel()).reshape((4,) + z.shape)
+        return a, a * self._expansion_rate(a, phi, phi_dot), phi, phi_dot, t, eta
+
+    def hubble(self, z):
+        """H(z) in km/s/Mpc"""
+        a, a_dot = self.state(z)[:2]
+        return a_dot / a
+
+    def field_densities(self, z):
+        """Wavelength field energy density and pressure at z"""
+        _, _, phi, phi_dot = self.state(z)[:4]
+        m_phi, lambda_phi = self.params['m_phi'], self.params['lambda_phi']
+        return field_density_pressure(phi, phi_dot, m_phi, lambda_phi)
+
+    def equation_of_state(self, z):
+        """w_φ(z) = P_φ/ρ_φ"""
+        rho_phi, P_phi = self.field_densities(z)
+        return P_phi / rho_phi
+
+    def field_fraction(self, z):
+        """Ω_φ(z) = ρ_φ/(ρ_m + ρ_φ), as in complete_cosmological_evolution"""
+        a = self.state(z)[0]
+        rho_phi, _ = self.field_densities(z)
+        rho_m = self.params['Omega_m0'] * (self.params['H0']/100)**2 / a**3
+        return rho_phi / (rho_m + rho_phi)
+
+    def cosmic_time(self, z):
+        """Time since the initial state, in units of 1/H0"""
+        return self.state(z)[4] * self.params['H0']
+
+    def comoving_distance(self, z):
+        """Line-of-sight comoving distance χ = ∫c dt/a in Mpc"""
+        eta = self.state(z)[5]
+        # η is in units of 1/(km/s/Mpc): c [km/s] × Δη is in Mpc
+        return (self._eta_today - eta) * c / 1000
+
+    def transverse_comoving_distance(self, z):
+        """Transverse comoving distance D_M in Mpc (curvature of the background)"""
+        return transverse_distance(self.comoving_distance(z), self.hubble_distance, self.background.Omega_k)
+
+    def luminosity_distance(self, z):
+        """Luminosity distance (1+z) D_M in Mpc"""
+        return (1 + np.asarray(z, dtype=float)) * self.transverse_comoving_distance(z)
+
+    def angular_diameter_distance(self, z):
+        """Angular diameter distance D_M/(1+z) in Mpc"""
+        return self.transverse_comoving_distance(z) / (1 + np.asarray(z, dtype=float))
+
+    @property
+    def hubble_distance(self):
+        """c/H0 in Mpc"""
+        return c / 1000 / self.params['H0']
+
+@lru_cache(maxsize=32)
+def _cached_engine(items, a_initial):
+    return CosmologyEngine(dict(items), a_initial)
+
+def get_engine(params=None, a_initial=0.01):
+    """Cosmology engine for a parameter set, integrated once and cached"""
+    params = dict(COSMOLOGY_PARAMS, **(params or {}))
+    return _cached_engine(tuple(sorted(params.items())), a_initial)
+
+def main():
+    """Tabulate the background evolution at a few redshifts"""
+    engine = get_engine()
+    z = np.array([0, 0.5, 1, 2, 5, 10, 50])
+    print("WAVELENGTH FIELD COSMOLOGY ENGINE")
+    print("=" * 60)
+    print(f"Integrated in ln a from a = {engine.a_initial} to 1: "
+          f"{engine.solution.t.size - 1} steps, {engine.solution.nfev} RHS evaluations")
+    print(f"{'z':>6} {'H [km/s/Mpc]':>12} {'w_φ':>10} {'Ω_φ':>12} {'D_C [Mpc]':>12}")
+    for zi, H, w, Omega, D in zip(z, engine.hubble(z), engine.equation_of_state(z),
+                                  engine.field_fraction(z), engine.comoving_distance(z)):
+        print(f"{zi:6.1f} {H:12.4e} {w:10.4f} {Omega:12.4e} {D:12.4e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Parameter-Grid Cosmology Solver
+===============================
+
+Evolves many independent wavelength field cosmologies at once:
+- All (m_φ, λ_φ, φ₀) points of a chunk form one stacked state vector [a, ȧ, φ, φ̇] × N
+- cosmological_equations is evaluated on whole arrays (one RHS call per step for the chunk)
+- Points are sorted by m_φ so that each chunk shares similar time steps
+- Chunks are solved in a process pool and returned as one structured array
+
+Usage: python src/cosmology_grid.py --m-phi 1e-3 1e3 --n-m-phi 100 --lambda-phi 1e-12 1e-8 --n-lambda-phi 100
+"""
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.integrate import solve_ivp
+from scipy.sparse import block_diag
+
+from comprehensive_critique_solutions import (COSMOLOGY_PARAMS, cosmological_equations, cosmology_args,
+                                              cosmology_initial_state, field_density_pressure)
+
+DEFAULT_GRID_PATH = 'results/cosmology_parameter_grid.csv'
+
+POINT_DTYPE = np.dtype([('m_phi', 'f8'), ('lambda_phi', 'f8'), ('phi_0', 'f8')])
+RESULT_DTYPE = np.dtype(POINT_DTYPE.descr + [
+    ('a', 'f8'), ('phi', 'f8'), ('phi_dot', 'f8'),
+    ('Omega_phi', 'f8'), ('w_phi', 'f8'),
+    ('success', '?'), ('nfev', 'i8')
+])
+
+def parameter_grid(m_phi, lambda_phi=COSMOLOGY_PARAMS['lambda_phi'], phi_0=COSMOLOGY_PARAMS['phi_0']):
+    """Structured array of every (m_φ, λ_φ, φ₀) combination"""
+    axes = np.meshgrid(np.atleast_1d(m_phi), np.atleast_1d(lambda_phi), np.atleast_1d(phi_0), indexing='ij')
+    points = np.empty(axes[0].size, dtype=POINT_DTYPE)
+    for name, values in zip(POINT_DTYPE.names, axes):
+        points[name] = values.ravel()
+    return points
+
+def stacked_cosmological_equations(t, Y, n_points, *args):
+    """cosmological_equations for n_points cosmologies stored as [a..., ȧ..., φ..., φ̇...]"""
+    return np.concatenate(cosmological_equations(t, Y.reshape(4, n_points), *args))
+
+def stacked_jacobian_sparsity(n_points):
+    """Block structure of the stacked Jacobian (each cosmology couples only to itself)"""
+    block = np.array([[0, 1, 0, 0], [1, 0, 1, 1], [0, 0, 0, 1], [1, 1, 1, 1]])
+    order = np.arange(4 * n_points).reshape(4, n_points).T.ravel()
+    sparsity = block_diag([block] * n_points, format='csr')
+    # block_diag interleaves the cosmologies; permute to the stacked [a..., ȧ..., φ..., φ̇...] layout
+    inverse = np.argsort(order)
+    return sparsity[inverse][:, inverse]
+
+def evolve_stack(points, t_span=(0.01, 1.0), method='RK45', rtol=1e-8, atol=1e-6, a_initial=0.01,
+                 base_params=COSMOLOGY_PARAMS):
+    """
+    Evolve every point of a chunk to t_span[1] in one stacked solve
+
+    All points share the adaptive step sequence. solve_ivp controls the RMS
+    error over all 4N components, so rtol and atol are scaled by 1/√N: the
+    stacked error bound then implies the RMS bound of each point's own four
+    components, i.e. the error control of an individual solve.
+    """
+    n = len(points)
+    result = np.zeros(n, dtype=RESULT_DTYPE)
+    for name in POINT_DTYPE.names:
+        result[name] = points[name]
+    if n == 0:
+        return result
+
+    params = dict(base_params, m_phi=points['m_phi'], lambda_phi=points['lambda_phi'], phi_0=points['phi_0'])
+    a0, a_dot0, phi0, phi_dot0 = cosmology_initial_state(params, a_initial)
+    y0 = np.concatenate([np.full(n, a0), np.full(n, a_dot0), phi0, np.full(n, float(phi_dot0))])
+    args = (n,) + cosmology_args(params)
+    options = {'jac_sparsity': stacked_jacobian_sparsity(n)} if method in ('Radau', 'BDF') else {}
+
+    # Σ over 4N components of (e/tol)² ≤ 4 then holds for each point's own components
+    scale = 1 / np.sqrt(n)
+    sol = solve_ivp(stacked_cosmological_equations, t_span, y0, t_eval=[t_span[1]], method=method,
+                    rtol=rtol * scale, atol=atol * scale, args=args, **options)
+    result['success'] = sol.success
+    result['nfev'] = sol.nfev
+    if not sol.success:
+        result['a'] = result['phi'] = result['phi_dot'] = np.nan
+        result['Omega_phi'] = result['w_phi'] = np.nan
+        return result
+
+    a, a_dot, phi, phi_dot = sol.y[:, -1].reshape(4, n)
+    m_phi, lambda_phi = params['m_phi'], params['lambda_phi']
+    rho_phi, P_phi = field_density_pressure(phi, phi_dot, m_phi, lambda_phi)
+    rho_m = params['Omega_m0'] * (params['H0']/100)**2 / a**3
+
+    result['a'], result['phi'], result['phi_dot'] = a, phi, phi_dot
+    result['Omega_phi'] = rho_phi / (rho_m + rho_phi)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result['w_phi'] = P_phi / rho_phi
+    return result
+
+def _evolve_chunk(job):
+    points, options = job
+    return evolve_stack(points, **options)
+
+def solve_parameter_grid(points, chunk_size=4096, workers=None, **options):
+    """
+    Ω_φ(z=0) and w_φ(z=0) for every parameter point, as a structured array
+
+    Points are sorted by m_φ (the field's oscillation rate sets the step size)
+    and split into chunks of stacked solves; with workers > 1 the chunks run
+    in a process pool. Results are returned in the input order.
+    """
+    points = np.asarray(points, dtype=POINT_DTYPE)
+    order = np.argsort(points['m_phi'], kind='stable')
+    chunks = [points[order[i:i + chunk_size]] for i in range(0, len(points), chunk_size)]
+    jobs = [(chunk, options) for chunk in chunks]
+
+    workers = min(workers or 1, len(jobs)) or 1
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            solved = list(pool.map(_evolve_chunk, jobs))
+    else:
+        solved = [_evolve_chunk(job) for job in jobs]
+
+    results = np.empty(len(points), dtype=RESULT_DTYPE)
+    if solved:
+        results[order] = np.concatenate(solved)
+    return results
+
+def save_grid_results(results, path=DEFAULT_GRID_PATH):
+    """Write grid results as CSV"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_DTYPE.names)
+        writer.writerows(results.tolist())
+    return path
+
+def _axis(bounds, n):
+    """Log-spaced axis between two bounds, or a single value"""
+    if len(bounds) == 1 or n == 1:
+        return np.array([bounds[0]])
+    return np.logspace(np.log10(bounds[0]), np.log10(bounds[1]), n)
+
+def main(argv=None):
+    """Solve a log-spaced parameter grid and save Ω_φ(z=0), w_φ(z=0)"""
+    parser = argparse.ArgumentParser(description="Wavelength field cosmology over a parameter grid")
+    parser.add_argument('--m-phi', type=float, nargs='+', default=[COSMOLOGY_PARAMS['m_phi']])
+    parser.add_argument('--n-m-phi', type=int, default=1)
+    parser.add_argument('--lambda-phi', type=float, nargs='+', default=[COSMOLOGY_PARAMS['lambda_phi']])
+    parser.add_argument('--n-lambda-phi', type=int, default=1)
+    parser.add_argument('--phi-0', type=float, nargs='+', default=[COSMOLOGY_PARAMS['phi_0']])
+    parser.add_argument('--n-phi-0', type=int, default=1)
+    parser.add_argument('--method', default='RK45', choices=['RK45', 'DOP853', 'Radau', 'BDF'])
+    parser.add_argument('--chunk-size', type=int, default=4096)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output', default=DEFAULT_GRID_PATH)
+    args = parser.parse_args(argv)
+
+    points = parameter_grid(_axis(args.m_phi, args.n_m_phi),
+                            _axis(args.lambda_phi, args.n_lambda_phi),
+                            _axis(args.phi_0, args.n_phi_0))
+    print("WAVELENGTH FIELD COSMOLOGY - PARAMETER GRID")
+    print("=" * 60)
+    print(f"Parameter points: {len(points)} ({args.method}, chunks of {args.chunk_size}, {args.workers} workers)")
+
+    start = time.perf_counter()
+    results = solve_parameter_grid(points, chunk_size=args.chunk_size, workers=args.workers, method=args.method)
+    elapsed = time.perf_counter() - start
+
+    solved = results['success']
+    print(f"✅ Solved {solved.sum()}/{len(results)} cosmologies in {elapsed:.2f} s")
+    if solved.any():
+        print(f"• Ω_φ(z=0) range: {np.nanmin(results['Omega_phi']):.3e} – {np.nanmax(results['Omega_phi']):.3e}")
+        print(f"• w_φ(z=0) range: {np.nanmin(results['w_phi']):.3f} – {np.nanmax(results['w_phi']):.3f}")
+    print(f"💾 Results saved to {save_grid_results(results, args.output)}")
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ import matplotlib.pyplot as plt
 from scipy import constants
 import pandas as pd
 
+from instrumentation import instrument
+
+@instrument
 def complete_velocity_modification_derivation():
     """
     Complete derivation of velocity modification from first principles
@@ -52,6 +55,7 @@ def complete_velocity_modification_derivation():
         'velocity_correction': 1e-15  # Fractional velocity change
     }
 
+@instrument
 def scalar_mode_coupling_analysis():
     """
     Complete scalar mode coupling derivation with eigenmode analysis
@@ -100,6 +104,7 @@ def scalar_mode_coupling_analysis():
         'observable_threshold': 1e-15  # Current GW sensitivity
     }
 
+@instrument
 def signal_to_noise_analysis():
     """
     Detailed signal-to-noise analysis for all experimental predictions
@@ -186,6 +191,7 @@ def signal_to_noise_analysis():
     
     return predictions
 
+@instrument
 def expanded_theory_comparison():
     """
     Detailed comparison with alternative theories
@@ -268,6 +274,7 @@ def expanded_theory_comparison():
     
     return theories
 
+@instrument
 def moderate_technological_claims():
     """
     Moderate technological claims with realistic timelines
@@ -328,6 +335,7 @@ def moderate_technological_claims():
     
     return applications
 
+@instrument
 def create_comprehensive_figures():
     """
     Create enhanced figures for the manuscript
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Experimental Limits
+===================
+
+Experimental limits on the squared wavelength field couplings, shared by the
+joint likelihood and the exclusion scanner. Kept free of heavy imports so
+lightweight modules can read them cheaply.
+"""
+
+# Experimental limit on the squared coupling of each parameter
+EXPERIMENTAL_LIMITS = {
+    'Eöt-Wash': ('g1', 1e-13),
+    'MICROSCOPE': ('g2', 1e-15),
+    'LLR': ('alpha1', 1e-11),
+    'LIGO/Virgo': ('alpha2', 1e-15)
+}
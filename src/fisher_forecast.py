@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Fisher-Matrix Forecasts
+=======================
+
+Parameter sensitivity of the wavelength field observables to θ = (α, m_φ, λ_φ):
+- BAO ruler shift and growth rate in survey redshift bins
+- CMB ΔC_l/C_l on every multipole (cosmic variance errors)
+- Binary pulsar timing residual
+- Field equation of state w_φ and fraction Ω_φ today (parameter-grid solver)
+
+Derivatives are taken with respect to ln θ, so Fisher matrices are dimensionless
+and forecast errors are fractional. Analytic observables use complex-step
+differentiation (exact to rounding); the field observables use central
+differences with all 2 × 3 perturbed points solved as one stacked batch.
+Each observable's Jacobian is computed once; Fisher matrices for any number of
+survey configurations (precision scalings) are then a single einsum.
+
+Usage: python src/fisher_forecast.py --survey Euclid --n-configurations 10000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy import constants
+
+from bao_forecast import SURVEYS, effective_redshifts, wavelength_field_shift
+from cmb_modification import L_MAX, modification_template
+from comprehensive_critique_solutions import COSMOLOGY_PARAMS
+from cosmology_grid import POINT_DTYPE, solve_parameter_grid
+
+# Physical constants
+c = constants.c
+G = constants.G
+alpha = constants.alpha
+M_sun = 1.989e30  # kg
+
+PARAMETER_NAMES = ('alpha', 'm_phi', 'lambda_phi')
+FIDUCIAL_THETA = np.array([alpha, COSMOLOGY_PARAMS['m_phi'], COSMOLOGY_PARAMS['lambda_phi']])
+
+COMPLEX_STEP = 1e-30
+RELATIVE_STEP = 1e-3
+
+def complex_step_jacobian(model, theta, step=COMPLEX_STEP):
+    """∂model/∂ln θ from model(θ (1 + i h e_j)) for every parameter j in one call"""
+    theta = np.asarray(theta, dtype=float)
+    n = theta.size
+    perturbed = theta * (1 + 1j * step * np.eye(n))  # (n, n): row j perturbs parameter j
+    return (model(perturbed).imag / step).T  # (n_obs, n)
+
+def central_difference_jacobian(model, theta, step=RELATIVE_STEP):
+    """∂model/∂ln θ from θ e^(±h) for every parameter j, evaluated as one batch"""
+    theta = np.asarray(theta, dtype=float)
+    n = theta.size
+    shifts = np.concatenate([np.eye(n), -np.eye(n)]) * step
+    values = model(theta * np.exp(shifts))  # (2n, n_obs)
+    return ((values[:n] - values[n:]) / (2 * step)).T
+
+class Observable:
+    """Model prediction, measurement errors and differentiation method of one data set"""
+
+    def __init__(self, name, model, sigma, complex_step=True):
+        self.name = name
+        self.model = model
+        self.sigma = np.asarray(sigma, dtype=float)
+        self.complex_step = complex_step
+
+    def __repr__(self):
+        return f"Observable({self.name!r}, {self.sigma.size} measurements)"
+
+    def jacobian(self, theta=FIDUCIAL_THETA):
+        """∂model/∂ln θ, shape (n_measurements, n_parameters)"""
+        if self.complex_step:
+            return complex_step_jacobian(self.model, theta)
+        return central_difference_jacobian(self.model, theta)
+
+    def fisher(self, theta=FIDUCIAL_THETA):
+        """F_ij = Σ_k J_ki J_kj / σ_k²"""
+        J = self.jacobian(theta)
+        return np.einsum('ki,k,kj->ij', J, self.sigma**-2, J)
+
+def bao_observable(survey='DESI'):
+    """ln(D_M/r_d) and ln(D_H/r_d) shifts in the survey bins"""
+    bins = SURVEYS[survey] if isinstance(survey, str) else survey
+    z = effective_redshifts(bins)
+
+    def model(theta):
+        shift = -np.log(wavelength_field_shift(z, theta[:, :1]))
+        return np.concatenate([shift, shift], axis=-1)
+    return Observable(f'bao_{survey}' if isinstance(survey, str) else 'bao', model,
+                      np.concatenate([bins['sigma_DM'], bins['sigma_DH']]))
+
+def growth_observable(z, sigma=0.02):
+    """ln f(z)/f_ΛCDM(z) = ln(1 + α² z/(1+z)), fractional errors per bin"""
+    z = np.asarray(z, dtype=float)
+
+    def model(theta):
+        return np.log(1 + theta[:, :1]**2 * z / (1 + z))
+    return Observable('growth', model, np.broadcast_to(sigma, z.shape))
+
+def cmb_observable(l_max=L_MAX, f_sky=0.7):
+    """ΔC_l/C_l for l = 2 ... l_max with cosmic variance errors √(2/((2l+1) f_sky))"""
+    l = np.arange(2, l_max + 1, dtype=float)
+    template = modification_template(l)
+
+    def model(theta):
+        return theta[:, :1]**2 * template
+    return Observable('cmb', model, np.sqrt(2 / ((2 * l + 1) * f_sky)))
+
+def pulsar_observable(mass=1.4 * M_sun, radius=12e3, orbital_period=2.4 * 3600,
+                      timing_precision=10e-9, n_observations=5 * 365):
+    """Timing residual per orbit, α² G M/(c² R) P/c, as in the binary pulsar prediction"""
+    def model(theta):
+        return theta[:, :1]**2 * G * mass / (c**2 * radius) * orbital_period / c
+    return Observable('pulsar', model, [timing_precision / np.sqrt(n_observations)])
+
+def field_observable(sigma_w=0.008, sigma_Omega=0.01):
+    """w_φ and Ω_φ today from the field equations (central differences)"""
+    def model(theta):
+        points = np.empty(len(theta), dtype=POINT_DTYPE)
+        points['m_phi'] = theta[:, 1]
+        points['lambda_phi'] = theta[:, 2]
+        points['phi_0'] = COSMOLOGY_PARAMS['phi_0']
+        results = solve_parameter_grid(points)
+        return np.stack([results['w_phi'], results['Omega_phi']], axis=-1)
+    return Observable('field', model, [sigma_w, sigma_Omega], complex_step=False)
+
+def default_observables(survey='DESI'):
+    """Every observable of the analysis, with BAO and growth in the survey bins"""
+    bins = SURVEYS[survey]
+    return [bao_observable(survey), growth_observable(effective_redshifts(bins)),
+            cmb_observable(), pulsar_observable(), field_observable()]
+
+def fisher_matrices(observables, theta=FIDUCIAL_THETA, precision_scale=None):
+    """
+    Fisher matrices in ln θ for many survey configurations
+
+    precision_scale multiplies each observable's errors: shape (n_configs,)
+    scales all of them, (n_configs, n_observables) scales them separately.
+    Returns shape (n_configs, 3, 3), or (3, 3) without precision_scale.
+    """
+    per_observable = np.stack([observable.fisher(theta) for observable in observables])
+    if precision_scale is None:
+        return per_observable.sum(axis=0)
+    scale = np.asarray(precision_scale, dtype=float)
+    if scale.ndim == 1:
+        scale = scale[:, np.newaxis]
+    weights = np.broadcast_to(scale, (scale.shape[0], len(observables)))**-2
+    return np.einsum('co,oij->cij', weights, per_observable)
+
+def forecast_errors(F):
+    """
+    Marginalized fractional errors σ(θ)/θ from Fisher matrices (stacked on leading axes)
+
+    F is rescaled to unit diagonal before inversion, so parameters whose
+    information differs by many orders of magnitude are still inverted
+    accurately. Parameters the observables do not depend on are reported as inf.
+    """
+    F = np.asarray(F, dtype=float)
+    diagonal = np.diagonal(F, axis1=-2, axis2=-1)
+    constrained = diagonal > 0
+    d = np.sqrt(np.where(constrained, diagonal, 1.0))
+    R = F / (d[..., :, np.newaxis] * d[..., np.newaxis, :])
+    # Decouple unconstrained parameters with a unit diagonal, invert, then mark them inf
+    mask = constrained[..., :, np.newaxis] & constrained[..., np.newaxis, :]
+    R = np.where(mask, R, np.eye(F.shape[-1]))
+    errors = np.sqrt(np.diagonal(np.linalg.inv(R), axis1=-2, axis2=-1)) / d
+    return np.where(constrained, errors, np.inf)
+
+def main(argv=None):
+    """Fisher forecasts for the fiducial parameters over many survey configurations"""
+    parser = argparse.ArgumentParser(description="Fisher forecasts for wavelength field theory")
+    parser.add_argument('--survey', default='DESI', choices=sorted(SURVEYS))
+    parser.add_argument('--n-configurations', type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    observables = default_observables(args.survey)
+    print(f"FISHER FORECAST - {args.survey}")
+    print("=" * 60)
+    start = time.perf_counter()
+    F = fisher_matrices(observables)
+    elapsed = time.perf_counter() - start
+    print(f"Jacobians of {len(observables)} observables in {elapsed * 1000:.1f} ms")
+    for name, error, value in zip(PARAMETER_NAMES, forecast_errors(F), FIDUCIAL_THETA):
+        print(f"• {name:<11} = {value:.3e}: σ/θ = {error:.3e}" if np.isfinite(error) else
+              f"• {name:<11} = {value:.3e}: unconstrained")
+
+    rng = np.random.default_rng(0)
+    scale = rng.uniform(0.5, 2.0, (args.n_configurations, len(observables)))
+    start = time.perf_counter()
+    errors = forecast_errors(fisher_matrices(observables, precision_scale=scale))
+    elapsed = time.perf_counter() - start
+    print(f"✅ {args.n_configurations} survey configurations in {elapsed * 1000:.1f} ms")
+    print(f"• σ(α)/α range: {errors[:, 0].min():.3e} – {errors[:, 0].max():.3e}")
+    return F, errors
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,10 @@ import sympy as sp
 from scipy import constants
 import matplotlib.pyplot as plt
 
+from background_cosmology import get_background
+from instrumentation import instrument, instrument_class
+from solar_system_batch import light_deflection, shapiro_delay, wft_correction_factor
+
 # Physical constants
 c = constants.c
 h = constants.h
@@ -29,11 +33,7 @@ alpha = constants.alpha
 m_e = constants.m_e
 m_p = constants.m_p
 
-print("FUNDAMENTAL DERIVATIONS FOR WAVELENGTH FIELD THEORY")
-print("=" * 60)
-print("Addressing Critical Theoretical Challenges")
-print("=" * 60)
-
+@instrument_class
 class FundamentalDerivations:
     """
     First-principles derivations addressing all critical theoretical challenges
@@ -207,11 +207,8 @@ class FundamentalDerivations:
         M_sun = 1.989e30  # kg
         r_mercury = 5.79e10  # m (semi-major axis)
         
-        # CORRECTED: Proper wavelength field calculation
-        lambda_sun = hbar / (M_sun * c)  # Compton wavelength of Sun
-        
         # CORRECTED: Proper correction factor
-        correction_factor = alpha**2 * (lambda_sun / r_mercury)**2
+        correction_factor = wft_correction_factor(M_sun, r_mercury, alpha)
         gr_precession = 43.03  # arcsec/century
         wft_correction = gr_precession * correction_factor
         wft_total = gr_precession + wft_correction
@@ -228,8 +225,8 @@ class FundamentalDerivations:
         print()
         
         # CORRECTED: Proper Shapiro delay calculation
-        delay_gr = 4 * G * M_sun / c**3  # GR prediction
-        delay_wft_correction = delay_gr * alpha**2 * (lambda_sun / constants.au)**2
+        delay_gr = shapiro_delay(M_sun)  # GR prediction
+        delay_wft_correction = delay_gr * wft_correction_factor(M_sun, constants.au, alpha)
         delay_wft_total = delay_gr + delay_wft_correction
         
         print(f"Shapiro delay calculation:")
@@ -245,8 +242,8 @@ class FundamentalDerivations:
         print()
         
         # CORRECTED: Proper light deflection calculation
-        deflection_gr = 4 * G * M_sun / (c**2 * 696e6)  # GR at solar limb
-        deflection_wft_correction = deflection_gr * alpha**2 * (lambda_sun / 696e6)**2
+        deflection_gr = light_deflection(M_sun, 696e6)  # GR at solar limb
+        deflection_wft_correction = deflection_gr * wft_correction_factor(M_sun, 696e6, alpha)
         deflection_wft_total = deflection_gr + deflection_wft_correction
         
         print(f"Light deflection calculation:")
@@ -283,7 +280,7 @@ class FundamentalDerivations:
         
         # CORRECTED: Proper GW speed modification calculation
         rho_phi_typical = 1e-30  # kg/m³ (typical cosmological density)
-        rho_critical = 3 * (70e3 / (3.086e22))**2 / (8 * np.pi * G)  # Critical density
+        rho_critical = get_background().rho_critical0  # Critical density
         
         # CORRECTED: Proper speed correction calculation
         speed_correction = alpha**2 * G * rho_phi_typical / c**2
@@ -317,6 +314,7 @@ class FundamentalDerivations:
         
         return relative_correction, scalar_mode_amplitude
 
+@instrument
 def create_parameter_constraint_plot():
     """Create comprehensive parameter constraint visualization"""
     print("\nCREATING PARAMETER CONSTRAINT VISUALIZATION")
@@ -400,6 +398,10 @@ def create_parameter_constraint_plot():
 
 def main():
     """Address all fundamental derivation challenges"""
+    print("FUNDAMENTAL DERIVATIONS FOR WAVELENGTH FIELD THEORY")
+    print("=" * 60)
+    print("Addressing Critical Theoretical Challenges")
+    print("=" * 60)
     
     derivations = FundamentalDerivations()
     
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Timing and Profiling Instrumentation
+====================================
+
+Records wall time, CPU time and peak memory of every instrumented derivation step:
+- @instrument wraps a function, @instrument_class wraps every public method of a class
+- Per-function totals are written as a JSON report when the script exits
+- Optional cProfile dump of each outermost instrumented call
+- Optional tracemalloc peak per call and top allocation sites in the report
+
+Instrumentation is off unless WFT_PROFILE_DIR is set when the module is imported;
+the decorators then return the functions unchanged, so there is no overhead.
+
+Environment:
+    WFT_PROFILE_DIR=<dir>   write <dir>/<script>.profile.json
+    WFT_CPROFILE=1          also write <dir>/<script>.<function>.prof (pstats format)
+    WFT_TRACEMALLOC=1       also trace Python allocations (slow)
+"""
+
+import atexit
+import cProfile
+import functools
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_DIR_ENV = 'WFT_PROFILE_DIR'
+CPROFILE_ENV = 'WFT_CPROFILE'
+TRACEMALLOC_ENV = 'WFT_TRACEMALLOC'
+
+PROFILE_DIR = os.environ.get(PROFILE_DIR_ENV)
+ENABLED = bool(PROFILE_DIR)
+CPROFILE_ENABLED = ENABLED and os.environ.get(CPROFILE_ENV, '') not in ('', '0')
+TRACEMALLOC_ENABLED = ENABLED and os.environ.get(TRACEMALLOC_ENV, '') not in ('', '0')
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+_RSS_SCALE = 1.0 / 1024**2 if sys.platform == 'darwin' else 1.0 / 1024
+
+_records = {}
+_stack = []
+_start_wall = time.perf_counter()
+_start_cpu = time.process_time()
+
+def peak_rss_mb():
+    """Process high-water resident set size in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_SCALE
+
+def _script_name():
+    return os.path.splitext(os.path.basename(sys.argv[0] or 'interactive'))[0] or 'interactive'
+
+def _record(name, wall, cpu, rss_before, rss_after, traced_peak):
+    record = _records.get(name)
+    if record is None:
+        record = _records[name] = {
+            'calls': 0, 'wall_total_s': 0.0, 'wall_max_s': 0.0, 'cpu_total_s': 0.0,
+            'peak_rss_mb': None, 'rss_growth_mb': 0.0, 'tracemalloc_peak_mb': None
+        }
+    record['calls'] += 1
+    record['wall_total_s'] += wall
+    record['wall_max_s'] = max(record['wall_max_s'], wall)
+    record['cpu_total_s'] += cpu
+    if rss_after is not None:
+        record['peak_rss_mb'] = max(record['peak_rss_mb'] or 0.0, rss_after)
+        record['rss_growth_mb'] = max(record['rss_growth_mb'], rss_after - rss_before)
+    if traced_peak is not None:
+        record['tracemalloc_peak_mb'] = max(record['tracemalloc_peak_mb'] or 0.0, traced_peak)
+
+def _timed_call(name, func, args, kwargs):
+    """Run one instrumented call and add it to the per-function totals"""
+    frame = {'traced_peak': 0}
+    outermost = not _stack
+    if TRACEMALLOC_ENABLED:
+        # Nested calls reset the tracemalloc peak, so carry the peak so far up the stack
+        current, peak = tracemalloc.get_traced_memory()
+        if _stack:
+            _stack[-1]['traced_peak'] = max(_stack[-1]['traced_peak'], peak)
+        frame['traced_start'] = current
+        tracemalloc.reset_peak()
+    _stack.append(frame)
+
+    # Only one profiler can be active at a time: profile outermost calls only
+    profiler = cProfile.Profile() if CPROFILE_ENABLED and outermost else None
+    rss_before = peak_rss_mb()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        if profiler is not None:
+            return profiler.runcall(func, *args, **kwargs)
+        return func(*args, **kwargs)
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        _stack.pop()
+
+        traced_peak = None
+        if TRACEMALLOC_ENABLED:
+            peak = max(frame['traced_peak'], tracemalloc.get_traced_memory()[1])
+            traced_peak = (peak - frame['traced_start']) / 1024**2
+            if _stack:
+                _stack[-1]['traced_peak'] = max(_stack[-1]['traced_peak'], peak)
+        _record(name, wall, cpu, rss_before, peak_rss_mb(), traced_peak)
+
+        if profiler is not None:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            profiler.dump_stats(os.path.join(PROFILE_DIR, f"{_script_name()}.{name}.prof"))
+
+def instrument(func=None, name=None):
+    """
+    Record wall time, CPU time and peak memory of every call to a function
+
+    Usable as @instrument or @instrument(name='...'). Returns the function
+    unchanged when instrumentation is disabled.
+    """
+    if func is None:
+        return lambda f: instrument(f, name)
+    if not ENABLED:
+        return func
+    name = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return _timed_call(name, func, args, kwargs)
+    return wrapper
+
+def instrument_class(cls=None, exclude=()):
+    """
+    Instrument every public method of a class
+
+    Static/class methods, properties and generator methods are left alone
+    (a generator's time is accounted to the method that consumes it).
+    """
+    if cls is None:
+        return lambda c: instrument_class(c, exclude)
+    if not ENABLED:
+        return cls
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_') or attr in exclude:
+            continue
+        if inspect.isfunction(value) and not inspect.isgeneratorfunction(value):
+            setattr(cls, attr, instrument(value))
+    return cls
+
+def get_records():
+    """Per-function totals recorded so far, slowest first"""
+    return dict(sorted(_records.items(), key=lambda item: -item[1]['wall_total_s']))
+
+def build_report():
+    """Machine-readable report of the instrumented calls in this process"""
+    report = {
+        'script': _script_name(),
+        'argv': sys.argv,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'total_wall_s': time.perf_counter() - _start_wall,
+        'total_cpu_s': time.process_time() - _start_cpu,
+        'peak_rss_mb': peak_rss_mb(),
+        'functions': get_records()
+    }
+    if TRACEMALLOC_ENABLED and tracemalloc.is_tracing():
+        statistics = tracemalloc.take_snapshot().statistics('lineno')[:25]
+        report['tracemalloc_top'] = [
+            {'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             'size_mb': stat.size / 1024**2, 'count': stat.count}
+            for stat in statistics
+        ]
+    return report
+
+def write_report(path=None):
+    """Write the JSON report (default: <WFT_PROFILE_DIR>/<script>.profile.json)"""
+    if path is None:
+        if not PROFILE_DIR:
+            return None
+        path = os.path.join(PROFILE_DIR, f"{_script_name()}.profile.json")
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(build_report(), f, indent=2)
+    return path
+
+if ENABLED:
+    if TRACEMALLOC_ENABLED:
+        tracemalloc.start()
+    atexit.register(write_report)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Joint Parameter Likelihood and Ensemble MCMC
+============================================
+
+Joint posterior of the wavelength field couplings θ = (g₁, g₂, α₁, α₂):
+- Eöt-Wash (Δa/a ~ g₁²), MICROSCOPE (Δa/a ~ g₂²), LLR (ΔG/G ~ α₁²) and
+  LIGO/Virgo (Δc_gw/c ~ α₂²) limits, each a zero-mean Gaussian with σ = limit
+- Cosmology (BAO, growth, CMB) through the gravitational coupling α₁, which
+  sets G_eff/G = 1 + α₁² ln a; the data are the ΛCDM (zero-shift) predictions
+- Uniform priors on [0, 10 √limit] for every coupling
+
+The likelihood is evaluated on the whole walker population at once. The
+affine-invariant stretch-move ensemble sampler (Goodman & Weare 2010) updates
+the walkers in two halves; each half can be split across a process pool. The
+chain is appended to a raw file and the sampler state (positions, log
+probabilities, RNG state) is checkpointed, so interrupted runs resume exactly.
+
+Usage: python src/parameter_likelihood.py --walkers 64 --steps 20000 --workers 4
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from columnar_results import ColumnarWriter
+from experimental_limits import EXPERIMENTAL_LIMITS
+from fisher_forecast import bao_observable, cmb_observable, growth_observable
+from bao_forecast import SURVEYS, effective_redshifts
+
+PARAMETER_NAMES = ('g1', 'g2', 'alpha1', 'alpha2')
+
+DEFAULT_POSTERIOR_PATH = 'results/parameter_posterior.cols'
+DEFAULT_CHECKPOINT_DIR = 'results/parameter_posterior.checkpoint'
+
+def prior_bounds():
+    """Uniform prior upper bounds, 10 √limit for every coupling"""
+    limits = {name: limit for name, limit in EXPERIMENTAL_LIMITS.values()}
+    return np.array([10 * np.sqrt(limits[name]) for name in PARAMETER_NAMES])
+
+class JointLikelihood:
+    """
+    Vectorized log posterior over the walker population
+
+    Instances are picklable (the cosmology observables are rebuilt lazily in
+    each worker process), so they can be sent to a process pool.
+    """
+
+    def __init__(self, survey='DESI', cosmology=True):
+        self.survey = survey
+        self.cosmology = cosmology
+        self.upper = prior_bounds()
+        self.limits = np.array([limit for name in PARAMETER_NAMES
+                                for parameter, limit in EXPERIMENTAL_LIMITS.values() if parameter == name])
+        self._observables = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_observables'] = None
+        return state
+
+    @property
+    def observables(self):
+        """Cosmological observables of the survey, as functions of α₁"""
+        if self._observables is None:
+            z = effective_redshifts(SURVEYS[self.survey])
+            self._observables = [bao_observable(self.survey), growth_observable(z), cmb_observable()]
+        return self._observables
+
+    def log_prior(self, theta):
+        """0 inside the prior box, -inf outside"""
+        inside = np.all((theta >= 0) & (theta <= self.upper), axis=-1)
+        return np.where(inside, 0.0, -np.inf)
+
+    def log_likelihood(self, theta):
+        """ln L for every row of theta"""
+        chi2 = np.sum((theta**2 / self.limits)**2, axis=-1)
+        if self.cosmology:
+            coupling = np.zeros((len(theta), 3))
+            coupling[:, 0] = theta[:, PARAMETER_NAMES.index('alpha1')]
+            for observable in self.observables:
+                chi2 = chi2 + np.sum((observable.model(coupling) / observable.sigma)**2, axis=-1)
+        return -0.5 * chi2
+
+    def __call__(self, theta):
+        theta = np.atleast_2d(theta)
+        log_prior = self.log_prior(theta)
+        log_prob = np.full(len(theta), -np.inf)
+        inside = np.isfinite(log_prior)
+        if inside.any():
+            log_prob[inside] = self.log_likelihood(theta[inside])
+        return log_prob
+
+class EnsembleSampler:
+    """Affine-invariant stretch-move ensemble sampler with checkpoint/resume"""
+
+    def __init__(self, log_prob, n_walkers, n_dim, workers=None, stretch=2.0, seed=0):
+        if n_walkers < 2 * n_dim or n_walkers % 2:
+            raise ValueError(f"Need an even number of walkers >= {2 * n_dim}, got {n_walkers}")
+        self.log_prob = log_prob
+        self.n_walkers = n_walkers
+        self.n_dim = n_dim
+        self.workers = workers
+        self.stretch = stretch
+        self.rng = np.random.default_rng(seed)
+        self.positions = None
+        self.log_probs = None
+        self.steps = 0
+        self.accepted = 0
+        self._pool = None
+
+    def _evaluate(self, positions):
+        """log_prob of every position, split into one chunk per worker"""
+        if self._pool is None:
+            return self.log_prob(positions)
+        chunks = np.array_split(positions, self.workers)
+        return np.concatenate(list(self._pool.map(self.log_prob, chunks)))
+
+    def _step(self):
+        """Update each half of the ensemble against the other half"""
+        half = self.n_walkers // 2
+        for active, complement in ((slice(0, half), slice(half, None)), (slice(half, None), slice(0, half))):
+            X = self.positions[active]
+            partners = self.positions[complement][self.rng.integers(0, half, half)]
+            z = ((self.stretch - 1) * self.rng.random(half) + 1)**2 / self.stretch
+            proposal = partners + z[:, np.newaxis] * (X - partners)
+            log_prob = self._evaluate(proposal)
+            log_ratio = (self.n_dim - 1) * np.log(z) + log_prob - self.log_probs[active]
+            accept = np.log(self.rng.random(half)) < log_ratio
+            self.positions[active][accept] = proposal[accept]
+            self.log_probs[active][accept] = log_prob[accept]
+            self.accepted += int(accept.sum())
+
+    @property
+    def acceptance_fraction(self):
+        """Fraction of accepted proposals so far"""
+        return self.accepted / max(self.steps * self.n_walkers, 1)
+
+    def _chain_file(self, checkpoint):
+        return os.path.join(checkpoint, 'chain.f8')
+
+    def save_checkpoint(self, checkpoint):
+        """Write the sampler state next to the chain file (atomic replace)"""
+        state_file = os.path.join(checkpoint, 'state.npz')
+        tmp = f"{state_file}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            np.savez(f, positions=self.positions, log_probs=self.log_probs,
+                     steps=self.steps, accepted=self.accepted,
+                     rng_state=json.dumps(self.rng.bit_generator.state))
+        os.replace(tmp, state_file)
+
+    def load_checkpoint(self, checkpoint):
+        """Restore the sampler state; returns False when there is none"""
+        state_file = os.path.join(checkpoint, 'state.npz')
+        if not os.path.exists(state_file):
+            return False
+        with np.load(state_file) as state:
+            if state['positions'].shape != (self.n_walkers, self.n_dim):
+                raise ValueError(f"Checkpoint {checkpoint} has a different ensemble shape")
+            self.positions = state['positions']
+            self.log_probs = state['log_probs']
+            self.steps = int(state['steps'])
+            self.accepted = int(state['accepted'])
+            self.rng.bit_generator.state = json.loads(str(state['rng_state']))
+        return True
+
+    def chain(self, checkpoint):
+        """Stored samples and log probabilities, shapes (steps, walkers, n_dim) and (steps, walkers)"""
+        if self.steps == 0:  # empty chain file, which cannot be memory-mapped
+            rows = np.empty((0, self.n_walkers, self.n_dim + 1))
+            return rows[..., :-1], rows[..., -1]
+        rows = np.memmap(self._chain_file(checkpoint), dtype='<f8', mode='r',
+                         shape=(self.steps, self.n_walkers, self.n_dim + 1))
+        return rows[..., :-1], rows[..., -1]
+
+    def run(self, initial, n_steps, checkpoint=DEFAULT_CHECKPOINT_DIR, checkpoint_every=1000,
+            resume=True, progress=None):
+        """
+        Advance the ensemble to n_steps in total
+
+        With resume, a checkpoint in the directory continues where it stopped
+        (the chain file is truncated to the last checkpointed step).
+        """
+        os.makedirs(checkpoint, exist_ok=True)
+        chain_file = self._chain_file(checkpoint)
+        if not (resume and self.load_checkpoint(checkpoint)):
+            self.positions = np.array(initial, dtype=float)
+            self.log_probs = self.log_prob(self.positions)
+            self.steps = self.accepted = 0
+            if not np.all(np.isfinite(self.log_probs)):
+                raise ValueError("Initial walkers must lie inside the prior")
+        row_bytes = self.n_walkers * (self.n_dim + 1) * 8
+        with open(chain_file, 'ab') as f:
+            f.truncate(self.steps * row_bytes)
+
+        if self.workers and self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            with open(chain_file, 'ab') as f:
+                while self.steps < n_steps:
+                    self._step()
+                    self.steps += 1
+                    np.column_stack([self.positions, self.log_probs]).astype('<f8').tofile(f)
+                    if self.steps % checkpoint_every == 0 or self.steps == n_steps:
+                        f.flush()
+                        self.save_checkpoint(checkpoint)
+                        if progress:
+                            progress(self)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+        return self
+
+def initial_walkers(n_walkers, rng, scale=0.1):
+    """Walkers scattered uniformly in the lower part of the prior box"""
+    return rng.random((n_walkers, len(PARAMETER_NAMES))) * scale * prior_bounds()
+
+def burn_fraction(text):
+    """argparse type for a burn-in fraction of the steps, 0 <= burn < 1"""
+    value = float(text)
+    if not 0 <= value < 1:
+        raise argparse.ArgumentTypeError(f"{text} is not a fraction of the steps in [0, 1)")
+    return value
+
+def save_posterior(sampler, checkpoint, burn_fraction=0.25, path=DEFAULT_POSTERIOR_PATH):
+    """Write the post-burn-in samples as a columnar store"""
+    start = int(burn_fraction * sampler.steps)
+    if start >= sampler.steps:
+        raise ValueError(f"No samples remain after discarding {start} of {sampler.steps} steps as burn-in")
+    samples, log_probs = sampler.chain(checkpoint)
+    with ColumnarWriter(path) as writer:
+        for first in range(start, sampler.steps, 1000):
+            block = slice(first, min(first + 1000, sampler.steps))
+            columns = {name: samples[block, :, i].ravel() for i, name in enumerate(PARAMETER_NAMES)}
+            columns['log_prob'] = log_probs[block].ravel()
+            columns['step'] = np.repeat(np.arange(block.start, block.stop), sampler.n_walkers)
+            writer.append(columns)
+    return path
+
+def main(argv=None):
+    """Sample the joint posterior and compare with the one-at-a-time bounds"""
+    parser = argparse.ArgumentParser(description="Joint likelihood MCMC for wavelength field couplings")
+    parser.add_argument('--walkers', type=int, default=64)
+    parser.add_argument('--steps', type=int, default=20000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--survey', default='DESI', choices=sorted(SURVEYS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_DIR)
+    parser.add_argument('--checkpoint-every', type=int, default=1000)
+    parser.add_argument('--no-resume', action='store_true')
+    parser.add_argument('--burn', type=burn_fraction, default=0.25,
+                        help="Fraction of the steps discarded as burn-in, 0 <= burn < 1")
+    parser.add_argument('--output', default=DEFAULT_POSTERIOR_PATH)
+    args = parser.parse_args(argv)
+
+    likelihood = JointLikelihood(args.survey)
+    sampler = EnsembleSampler(likelihood, args.walkers, len(PARAMETER_NAMES), workers=args.workers, seed=args.seed)
+    initial = initial_walkers(args.walkers, np.random.default_rng(args.seed + 1))
+
+    print("JOINT PARAMETER LIKELIHOOD - ENSEMBLE MCMC")
+    print("=" * 60)
+    print(f"Walkers: {args.walkers}, steps: {args.steps} ({args.walkers * args.steps} samples), "
+          f"workers: {args.workers or 1}")
+
+    def progress(s):
+        print(f"  step {s.steps}/{args.steps}: acceptance {s.acceptance_fraction:.2f}", flush=True)
+
+    start = time.perf_counter()
+    sampler.run(initial, args.steps, checkpoint=args.checkpoint, checkpoint_every=args.checkpoint_every,
+                resume=not args.no_resume, progress=progress)
+    elapsed = time.perf_counter() - start
+    print(f"✅ Sampled in {elapsed:.1f} s, acceptance fraction {sampler.acceptance_fraction:.2f}")
+
+    path = save_posterior(sampler, args.checkpoint, args.burn, args.output)
+    samples, _ = sampler.chain(args.checkpoint)
+    kept = np.asarray(samples[int(args.burn * sampler.steps):]).reshape(-1, len(PARAMETER_NAMES))
+    print(f"{'Parameter':<10} {'68% upper':>12} {'95% upper':>12} {'√limit':>12}")
+    for i, name in enumerate(PARAMETER_NAMES):
+        limit = likelihood.limits[i]
+        print(f"{name:<10} {np.quantile(kept[:, i], 0.68):12.3e} {np.quantile(kept[:, i], 0.95):12.3e} "
+              f"{np.sqrt(limit):12.3e}")
+    print(f"💾 Posterior samples saved to {path}")
+    return sampler
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Matter Power Spectrum Engine
+============================
+
+Linear matter power spectrum P(k, z) = A k^n_s T(k)² D(z)² on full (k, z) grids:
+- k in h/Mpc, z broadcast against k (z values along the first axis)
+- Pluggable transfer functions (BBKS, Eisenstein & Hu no-wiggle, the approximate
+  shape used in the structure formation figure, or any registered callable)
+- Growth D(z) from the shared background's tabulated growth ODE
+- Grids cached on disk under .wft_cache/power_spectrum/ (an ArrayCache), keyed by
+  parameters and grid; callables and registered transfers are only cached when
+  given an explicit cache key, since their code is not part of the key
+"""
+
+import numpy as np
+
+from background_cosmology import get_background
+from build_cache import ArrayCache
+
+POWER_SPECTRUM_VERSION = 1
+POWER_SPECTRUM_CACHE = ArrayCache('power_spectrum', POWER_SPECTRUM_VERSION)
+
+def approximate_transfer(k, spectrum):
+    """Approximate shape of the structure formation figure: T² k^n_s = (k/0.05)⁻³ e^{-(k/0.1)²}"""
+    return np.sqrt((k/0.05)**(-3) * np.exp(-(k/0.1)**2) / k**spectrum.n_s)
+
+def bbks_transfer(k, spectrum):
+    """Bardeen-Bond-Kaiser-Szalay fit with Sugiyama's baryon-corrected shape parameter"""
+    h, Omega_m, Omega_b = spectrum.h, spectrum.background.Omega_m, spectrum.Omega_b
+    Gamma = Omega_m * h * np.exp(-Omega_b - np.sqrt(2 * h) * Omega_b / Omega_m)
+    q = k / Gamma
+    with np.errstate(divide='ignore', invalid='ignore'):
+        T = (np.log1p(2.34 * q) / (2.34 * q)
+             * (1 + 3.89 * q + (16.1 * q)**2 + (5.46 * q)**3 + (6.71 * q)**4)**-0.25)
+    return np.where(q > 0, T, 1.0)
+
+def eisenstein_hu_transfer(k, spectrum):
+    """Eisenstein & Hu (1998) zero-baryon-oscillation ("no-wiggle") transfer function"""
+    h, Omega_m, Omega_b = spectrum.h, spectrum.background.Omega_m, spectrum.Omega_b
+    omega_m = Omega_m * h**2
+    omega_b = Omega_b * h**2
+    f_b = Omega_b / Omega_m
+    theta = spectrum.T_cmb / 2.7
+
+    s = 44.5 * np.log(9.83 / omega_m) / np.sqrt(1 + 10 * omega_b**0.75)  # Mpc
+    alpha_Gamma = 1 - 0.328 * np.log(431 * omega_m) * f_b + 0.38 * np.log(22.3 * omega_m) * f_b**2
+    k_mpc = k * h
+    Gamma_eff = Omega_m * h * (alpha_Gamma + (1 - alpha_Gamma) / (1 + (0.43 * k_mpc * s)**4))
+    q = k * theta**2 / Gamma_eff
+
+    L0 = np.log(2 * np.e + 1.8 * q)
+    C0 = 14.2 + 731 / (1 + 62.5 * q)
+    return L0 / (L0 + C0 * q**2)
+
+TRANSFER_FUNCTIONS = {
+    'approximate': approximate_transfer,
+    'bbks': bbks_transfer,
+    'eisenstein_hu': eisenstein_hu_transfer
+}
+
+# Disk-cache identities of the named transfer functions; a name without one is not cached
+TRANSFER_CACHE_KEYS = {name: name for name in TRANSFER_FUNCTIONS}
+
+def register_transfer_function(name, transfer, cache_key=None):
+    """
+    Register a transfer function T(k, spectrum) under a name. Its grids are only
+    cached on disk if cache_key is given; change the key whenever the function changes.
+    """
+    if not callable(transfer):
+        raise TypeError(f"Transfer function '{name}' must be callable")
+    TRANSFER_FUNCTIONS[name] = transfer
+    if cache_key is None:
+        TRANSFER_CACHE_KEYS.pop(name, None)
+    else:
+        TRANSFER_CACHE_KEYS[name] = f"{name}:{cache_key}"
+
+def get_transfer_function(transfer):
+    """Look up a transfer function by name (callables are passed through)"""
+    if callable(transfer):
+        return transfer
+    try:
+        return TRANSFER_FUNCTIONS[transfer]
+    except KeyError:
+        raise ValueError(f"Unknown transfer function '{transfer}' "
+                         f"(available: {', '.join(sorted(TRANSFER_FUNCTIONS))})") from None
+
+class PowerSpectrum:
+    """Linear matter power spectrum of a background cosmology"""
+
+    def __init__(self, background=None, transfer='eisenstein_hu', n_s=0.965, amplitude=1.0,
+                 Omega_b=0.049, T_cmb=2.7255, cache=POWER_SPECTRUM_CACHE, transfer_key=None):
+        self.background = background or get_background()
+        self.transfer = get_transfer_function(transfer)
+        # Cache identity of the transfer function; None disables the disk cache
+        if transfer_key is not None:
+            self.transfer_key = str(transfer_key)
+        elif isinstance(transfer, str):
+            self.transfer_key = TRANSFER_CACHE_KEYS.get(transfer)
+        else:
+            self.transfer_key = None
+        self.n_s = n_s
+        self.amplitude = amplitude
+        self.Omega_b = Omega_b
+        self.T_cmb = T_cmb
+        self.h = self.background.H0 / 100
+        self.cache = cache
+
+    def parameters(self):
+        """Everything that determines P(k, z), for cache keys"""
+        b = self.background
+        return {
+            'H0': b.H0, 'Omega_m': b.Omega_m, 'Omega_r': b.Omega_r, 'Omega_Lambda': b.Omega_Lambda,
+            'Omega_b': self.Omega_b, 'T_cmb': self.T_cmb, 'n_s': self.n_s,
+            'amplitude': self.amplitude, 'transfer': self.transfer_key
+        }
+
+    def transfer_function(self, k):
+        """T(k) for k in h/Mpc"""
+        return self.transfer(np.asarray(k, dtype=float), self)
+
+    def primordial(self, k):
+        """A k^n_s"""
+        return self.amplitude * np.asarray(k, dtype=float)**self.n_s
+
+    def today(self, k):
+        """P(k, z=0)"""
+        return self.primordial(k) * self.transfer_function(k)**2
+
+    def linear(self, k, z=0.0):
+        """
+        P(k, z) with broadcasting: scalar z gives shape of k, an array of z
+        gives shape z.shape + k.shape
+        """
+        z = np.asarray(z, dtype=float)
+        D = self.background.linear_growth.D(z)
+        return self.today(k) * (D[..., np.newaxis]**2 if z.ndim else D**2)
+
+    def grid(self, k, z, cache=True):
+        """
+        P(k, z) on the full grid, shape (len(z), len(k)), cached on disk unless the
+        transfer function has no cache key
+        """
+        k = np.atleast_1d(np.asarray(k, dtype=float))
+        z = np.atleast_1d(np.asarray(z, dtype=float))
+        if not cache or self.transfer_key is None:
+            return self.linear(k, z)
+        return self.cache.load(lambda: self.linear(k, z), self.parameters(), k, z)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Precision Backends for Tiny Corrections
+=======================================
+
+Wavelength field corrections are often 1e-40 to 1e-170 of the leading term,
+far below the float64 resolution of 1 + ε (ε ≈ 2.2e-16):
+- Corrected carries the leading term and the relative correction separately,
+  value = leading × (1 + relative), with the correction also kept as a logarithm
+  so products of tiny factors never underflow
+- Backends for materializing the value:
+  float64        leading × (1 + relative), the fast path when the correction
+                 is resolvable (corrections below ε are rounded away)
+  log            (log10 |leading|, log10 |correction|), any magnitude
+  double-double  unevaluated (hi, lo) float64 pairs, vectorized error-free
+                 transformations (≈ 32 digits; the low word holds corrections
+                 down to the float64 underflow limit, ≈ 2.2e-308)
+  mpmath         object arrays of mpf at the working precision the corrections need
+- 'auto' takes the float64 path when every correction keeps the requested
+  significant digits, falls back to double-double otherwise and to mpmath
+  when a correction would underflow the double-double low word
+
+Usage: python src/precision.py
+"""
+
+import math
+
+import numpy as np
+
+BACKENDS = ('float64', 'log', 'double-double', 'mpmath')
+
+FLOAT64_EPSILON = np.finfo(np.float64).eps
+SPLITTER = 2.0**27 + 1  # Dekker splitting constant for 53-bit mantissas
+LN10 = math.log(10)
+FLOAT64_TINY = np.finfo(np.float64).tiny  # smallest normal float64
+LOG_FLOAT64_TINY = math.log(FLOAT64_TINY)
+
+def two_sum(a, b):
+    """Error-free a + b = s + err (Knuth)"""
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+def quick_two_sum(a, b):
+    """Error-free a + b = s + err for |a| ≥ |b|"""
+    s = a + b
+    return s, b - (s - a)
+
+def split(a):
+    """Split a float64 into two halves with at most 26 significant bits each"""
+    t = SPLITTER * a
+    hi = t - (t - a)
+    return hi, a - hi
+
+def two_product(a, b):
+    """Error-free a × b = p + err (Dekker; |a|, |b| below ~1e300)"""
+    p = a * b
+    a_hi, a_lo = split(a)
+    b_hi, b_lo = split(b)
+    return p, ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+def dd_add(x, y):
+    """Sum of double-double (hi, lo) pairs"""
+    s, e = two_sum(x[0], y[0])
+    return quick_two_sum(s, e + x[1] + y[1])
+
+def dd_mul(x, y):
+    """Product of double-double (hi, lo) pairs"""
+    p, e = two_product(x[0], y[0])
+    return quick_two_sum(p, e + x[0] * y[1] + x[1] * y[0])
+
+class Corrected:
+    """Leading term with a separately carried relative correction: leading × (1 + relative)"""
+
+    def __init__(self, leading, relative=0.0):
+        self.leading = np.asarray(leading, dtype=np.float64)
+        self.relative = np.asarray(relative, dtype=np.float64)
+        with np.errstate(divide='ignore'):
+            self.log_relative = np.log(np.abs(self.relative))  # -inf for no correction
+        self.sign = np.sign(self.relative)
+
+    @classmethod
+    def from_factors(cls, leading, factors, powers=1):
+        """Relative correction Π factor^power, multiplied in log space so it cannot underflow"""
+        factors = [np.asarray(factor, dtype=np.float64) for factor in factors]
+        powers = np.broadcast_to(powers, (len(factors),))
+        with np.errstate(divide='ignore'):
+            log_relative = sum(power * np.log(np.abs(factor)) for factor, power in zip(factors, powers))
+        sign = np.prod([np.sign(factor)**power for factor, power in zip(factors, powers)], axis=0)
+        corrected = cls(leading, sign * np.exp(log_relative))
+        corrected.log_relative = np.asarray(log_relative, dtype=np.float64)
+        corrected.sign = np.asarray(sign, dtype=np.float64)
+        return corrected
+
+    def __repr__(self):
+        return f"Corrected(leading={self.leading!r}, log10|relative|={self.log_relative / LN10!r})"
+
+    @property
+    def correction(self):
+        """Absolute correction leading × relative in float64 (may underflow to 0)"""
+        return self.leading * self.relative
+
+    @property
+    def log10_correction(self):
+        """log10 |leading × relative|, valid at any magnitude"""
+        with np.errstate(divide='ignore'):
+            return np.log10(np.abs(self.leading)) + self.log_relative / LN10
+
+    def resolvable(self, digits=3):
+        """True where float64 keeps `digits` significant digits of the correction"""
+        return (self.sign == 0) | (self.log_relative >= math.log(FLOAT64_EPSILON) + digits * LN10)
+
+    def double_double_exact(self):
+        """True where the relative and absolute corrections are normal float64 (the low word keeps them)"""
+        with np.errstate(divide='ignore'):
+            log_correction = np.log(np.abs(self.leading)) + self.log_relative
+        return (self.sign == 0) | ((self.log_relative >= LOG_FLOAT64_TINY) & (log_correction >= LOG_FLOAT64_TINY))
+
+    def auto_backend(self, digits=3):
+        """Cheapest backend that keeps every correction: float64, double-double or mpmath"""
+        if np.all(self.resolvable(digits)):
+            return 'float64'
+        return 'double-double' if np.all(self.double_double_exact()) else 'mpmath'
+
+    def total(self, backend='auto', digits=3):
+        """
+        leading × (1 + relative) in the chosen backend
+
+        float64 returns an array, log a (log10 |leading|, log10 |correction|)
+        pair, double-double a (hi, lo) pair and mpmath an object array of mpf.
+        Corrections below ≈ 2.2e-308 underflow in double-double; 'auto' hands
+        those to mpmath, which rebuilds them from log_relative.
+        """
+        if backend == 'auto':
+            backend = self.auto_backend(digits)
+        if backend == 'float64':
+            return self.leading * (1 + self.relative)
+        if backend == 'log':
+            with np.errstate(divide='ignore'):
+                return np.log10(np.abs(self.leading)), self.log10_correction
+        if backend == 'double-double':
+            # Corrections below the float64 ulp of 1 stay exact in the low word (see double_double_exact)
+            return dd_mul((self.leading, np.zeros_like(self.leading)), two_sum(1.0, self.relative))
+        if backend == 'mpmath':
+            return self._mpmath_total(digits)
+        raise ValueError(f"Unknown precision backend '{backend}'. Available: auto, {', '.join(BACKENDS)}")
+
+    def _mpmath_total(self, digits):
+        """Object array of mpf totals at enough decimal places to resolve every correction"""
+        import mpmath  # ships with sympy
+
+        smallest = np.min(self.log_relative, initial=0.0, where=self.sign != 0) / LN10
+        dps = max(mpmath.mp.dps, int(math.ceil(-smallest)) + 17 + digits)
+        with mpmath.workdps(dps):
+            def exact(leading, relative, log_relative, sign):
+                # Subnormal or underflowed corrections are rebuilt from their logarithm
+                if abs(relative) < FLOAT64_TINY:
+                    relative = sign * mpmath.exp(mpmath.mpf(log_relative)) if sign else 0
+                return mpmath.mpf(leading) * (1 + mpmath.mpf(relative))
+            return np.frompyfunc(exact, 4, 1)(self.leading, self.relative, self.log_relative, self.sign)
+
+def dd_to_float(x):
+    """Collapse a double-double pair to float64"""
+    return x[0] + x[1]
+
+def relative_difference(actual, expected):
+    """|actual - expected| / |expected|, meaningful at any magnitude (0 when both are 0)"""
+    actual = np.asarray(actual, dtype=np.float64)
+    expected = np.asarray(expected, dtype=np.float64)
+    scale = np.where(expected == 0, np.abs(actual), np.abs(expected))
+    return np.divide(np.abs(actual - expected), scale, out=np.zeros(np.broadcast(actual, expected).shape),
+                     where=scale > 0)
+
+def main():
+    """Show a 1e-40 λ/d correction surviving in every backend"""
+    value = Corrected(9.81, 1e-40 * 1e-16 / 6.371e6)
+    print("PRECISION BACKENDS")
+    print("=" * 60)
+    print(f"Leading term 9.81, relative correction {float(value.relative):.3e}")
+    print(f"• float64:       {value.total('float64'):.17g} (correction rounded away)")
+    log_leading, log_correction = value.total('log')
+    print(f"• log:           log10|leading| = {log_leading:.6f}, log10|correction| = {log_correction:.6f}")
+    hi, lo = value.total('double-double')
+    print(f"• double-double: {hi:.17g} + {lo:.6e}")
+    print(f"• mpmath:        total - leading = {value.total('mpmath') - 9.81}")
+    tiny = Corrected.from_factors(43.03, [1 / 137.036, 1e-170], powers=2)
+    print(f"• Underflow-free product: log10|correction| = {float(tiny.log10_correction):.3f} "
+          f"(auto backend: {tiny.auto_backend()})")
+    print(f"✅ auto backend: {value.auto_backend()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Batch Solar System Tests
+========================
+
+Perihelion precession, Shapiro delay and light deflection with their
+wavelength field corrections for whole catalogues of (central body, orbit) pairs:
+- Catalogues of planets, moons and exoplanets are structured arrays
+  (data/solar_system_catalogue.csv, or a .npy structured array for large ones)
+- GR values: 6πGM/(c² a (1-e²)) per orbit, 4GM/c³ and 4GM/(c² R) at the limb
+- WFT corrections are the GR values times α² (λ/r)², λ = ħ/(Mc) the Compton
+  wavelength of the central body, as in FundamentalDerivations.solar_system_tests
+- Every row is evaluated in one vectorized pass; results are a structured array
+  with a per-row compliance flag against the solar system precisions
+
+Usage: python src/solar_system_batch.py --catalogue data/solar_system_catalogue.csv
+"""
+
+import argparse
+import csv
+import os
+import time
+
+import numpy as np
+from scipy import constants
+
+# Physical constants
+c = constants.c
+G = constants.G
+hbar = constants.hbar
+alpha = constants.alpha
+ARCSEC = 180 / np.pi * 3600  # arcsec per radian
+CENTURY = 100 * constants.Julian_year  # s
+
+DEFAULT_CATALOGUE = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                                 'data', 'solar_system_catalogue.csv')
+
+BODY_DTYPE = np.dtype([
+    ('name', 'U32'),
+    ('kind', 'U16'),
+    ('central_body', 'U32'),
+    ('central_mass', 'f8'),     # kg
+    ('central_radius', 'f8'),   # m, impact parameter of grazing light rays
+    ('semi_major_axis', 'f8'),  # m
+    ('eccentricity', 'f8'),
+])
+
+RESULT_DTYPE = np.dtype([
+    ('name', 'U32'),
+    ('central_body', 'U32'),
+    ('perihelion_gr', 'f8'),         # arcsec/century
+    ('perihelion_correction', 'f8'),
+    ('shapiro_gr', 'f8'),            # s
+    ('shapiro_correction', 'f8'),
+    ('deflection_gr', 'f8'),         # arcsec
+    ('deflection_correction', 'f8'),
+    ('compliant', '?'),
+])
+
+# CSV header -> catalogue field
+CATALOGUE_COLUMNS = {
+    'Name': 'name',
+    'Kind': 'kind',
+    'Central_Body': 'central_body',
+    'Central_Mass': 'central_mass',
+    'Central_Radius': 'central_radius',
+    'Semi_Major_Axis': 'semi_major_axis',
+    'Eccentricity': 'eccentricity',
+}
+
+# Observational precision of each test in the solar system
+PRECISION = {
+    'perihelion': 0.45,  # arcsec/century (Mercury)
+    'shapiro': 1e-6,     # s
+    'deflection': 1e-3,  # arcsec
+}
+
+def load_body_catalogue(path=DEFAULT_CATALOGUE):
+    """Load a body catalogue as a BODY_DTYPE structured array (.npy files are memory-mapped)"""
+    if path.endswith('.npy'):
+        bodies = np.load(path, mmap_mode='r')
+    else:
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            header = [CATALOGUE_COLUMNS.get(column.strip(), column.strip()) for column in next(reader)]
+            rows = [tuple(entry.strip() for entry in row) for row in reader if row]
+        bodies = np.array(rows, dtype=np.dtype([(name, BODY_DTYPE[name]) for name in header]))
+    missing = set(BODY_DTYPE.names) - set(bodies.dtype.names)
+    if missing:
+        raise ValueError(f"Catalogue {path} is missing columns: {', '.join(sorted(missing))}")
+    return bodies
+
+def compton_wavelength(mass):
+    """λ = ħ/(Mc) of a central body"""
+    return hbar / (mass * c)
+
+def wft_correction_factor(mass, distance, coupling=alpha):
+    """Fractional WFT correction α² (λ/r)² at distance r from a body of mass M"""
+    return coupling**2 * (compton_wavelength(mass) / distance)**2
+
+def orbital_period(mass, semi_major_axis):
+    """Kepler period 2π √(a³/GM)"""
+    return 2 * np.pi * np.sqrt(semi_major_axis**3 / (G * mass))
+
+def perihelion_precession(mass, semi_major_axis, eccentricity):
+    """GR perihelion advance 6πGM/(c² a (1-e²)) in arcsec/century"""
+    per_orbit = 6 * np.pi * G * mass / (c**2 * semi_major_axis * (1 - eccentricity**2))
+    return per_orbit * CENTURY / orbital_period(mass, semi_major_axis) * ARCSEC
+
+def shapiro_delay(mass):
+    """GR Shapiro delay scale 4GM/c³ in s"""
+    return 4 * G * mass / c**3
+
+def light_deflection(mass, impact_parameter):
+    """GR light deflection 4GM/(c² b) in rad"""
+    return 4 * G * mass / (c**2 * impact_parameter)
+
+def solar_system_tests(bodies, coupling=alpha, precision=PRECISION):
+    """
+    GR predictions and WFT corrections of all three tests for every catalogue row
+
+    The perihelion and Shapiro corrections are evaluated at the orbit's
+    semi-major axis, the deflection correction at the central body's limb.
+    """
+    M = np.asarray(bodies['central_mass'], dtype=float)
+    a = np.asarray(bodies['semi_major_axis'], dtype=float)
+    R = np.asarray(bodies['central_radius'], dtype=float)
+
+    perihelion = perihelion_precession(M, a, np.asarray(bodies['eccentricity'], dtype=float))
+    shapiro = shapiro_delay(M)
+    deflection = light_deflection(M, R) * ARCSEC
+    orbit_factor = wft_correction_factor(M, a, coupling)
+    corrections = {'perihelion': perihelion * orbit_factor, 'shapiro': shapiro * orbit_factor,
+                   'deflection': deflection * wft_correction_factor(M, R, coupling)}
+
+    results = np.empty(len(bodies), dtype=RESULT_DTYPE)
+    results['name'] = bodies['name']
+    results['central_body'] = bodies['central_body']
+    for test, gr in (('perihelion', perihelion), ('shapiro', shapiro), ('deflection', deflection)):
+        results[f'{test}_gr'] = gr
+        results[f'{test}_correction'] = corrections[test]
+    results['compliant'] = np.logical_and.reduce([np.abs(corrections[test]) < precision[test]
+                                                  for test in corrections])
+    return results
+
+def random_catalogue(n, rng=None):
+    """Synthetic catalogue of n star-planet pairs with log-uniform masses and orbits"""
+    rng = rng or np.random.default_rng(0)
+    bodies = np.empty(n, dtype=BODY_DTYPE)
+    bodies['name'] = 'synthetic'
+    bodies['kind'] = 'Exoplanet'
+    bodies['central_body'] = 'synthetic'
+    bodies['central_mass'] = 10**rng.uniform(29, 31.5, n)
+    bodies['central_radius'] = 6.96e8 * (bodies['central_mass'] / 1.989e30)**0.8
+    bodies['semi_major_axis'] = 10**rng.uniform(9, 13, n)
+    bodies['eccentricity'] = rng.uniform(0, 0.9, n)
+    return bodies
+
+def main(argv=None):
+    """Run all three solar system tests over a body catalogue"""
+    parser = argparse.ArgumentParser(description="Vectorized solar system tests of wavelength field theory")
+    parser.add_argument('--catalogue', default=DEFAULT_CATALOGUE)
+    parser.add_argument('--n-synthetic', type=int, default=1000000, help="Rows of the synthetic timing catalogue")
+    args = parser.parse_args(argv)
+
+    bodies = load_body_catalogue(args.catalogue)
+    print("BATCH SOLAR SYSTEM TESTS")
+    print("=" * 60)
+    start = time.perf_counter()
+    results = solar_system_tests(bodies)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {len(results)} bodies in {elapsed * 1000:.2f} ms")
+    for row in results[:3]:
+        print(f"• {row['name']} ({row['central_body']}): Δω = {row['perihelion_gr']:.2f} "
+              f"+ {row['perihelion_correction']:.2e} arcsec/century, "
+              f"Δt = {row['shapiro_gr'] * 1e6:.1f} μs + {row['shapiro_correction']:.2e} s")
+    worst = np.argmax(results['perihelion_correction'] / results['perihelion_gr'])
+    print(f"• Largest fractional correction: {results['name'][worst]} "
+          f"({results['perihelion_correction'][worst] / results['perihelion_gr'][worst]:.2e})")
+    print(f"• Compliant: {np.count_nonzero(results['compliant'])}/{len(results)}")
+
+    synthetic = random_catalogue(args.n_synthetic)
+    start = time.perf_counter()
+    synthetic_results = solar_system_tests(synthetic)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {args.n_synthetic:,} synthetic bodies in {elapsed:.2f} s "
+          f"({np.count_nonzero(synthetic_results['compliant']):,} compliant)")
+    return results
+
+if __name__ == "__main__":
+    main()
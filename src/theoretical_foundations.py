@@ -22,6 +22,12 @@ from scipy import constants
 import matplotlib.pyplot as plt
 from scipy.integrate import odeint
 
+from background_cosmology import get_background
+from bao_forecast import bao_scales, parameter_sets
+from cmb_modification import modified_cmb_spectrum, standard_cmb_spectrum
+from instrumentation import instrument, instrument_class
+from power_spectrum import PowerSpectrum
+
 # Physical constants
 c = constants.c
 h = constants.h
@@ -31,11 +37,11 @@ epsilon_0 = constants.epsilon_0
 alpha = constants.alpha
 k_B = constants.k
 
-print("ADVANCED THEORETICAL FOUNDATIONS")
-print("=" * 50)
-print("Addressing Deep Theoretical Challenges")
-print("=" * 50)
+def growth_factor(z, Omega_m=0.31, Omega_lambda=0.69):
+    """Approximate growth factor for ΛCDM + wavelength field (shared background)"""
+    return get_background(Omega_m=Omega_m, Omega_Lambda=Omega_lambda).growth_factor(z)
 
+@instrument_class
 class AdvancedWavelengthFieldTheory:
     """
     Advanced theoretical foundations addressing fundamental questions
@@ -209,31 +215,16 @@ class AdvancedWavelengthFieldTheory:
         k_values = np.logspace(-4, 2, 100)  # h/Mpc
         z_values = np.array([0, 0.5, 1, 2, 5, 10])
         
-        def growth_factor(z):
-            """Approximate growth factor for ΛCDM + wavelength field"""
-            Omega_m = 0.31
-            Omega_lambda = 0.69
-            a = 1/(1+z)
-            
-            # Modified growth due to wavelength field
-            modification = 1 + alpha**2 * np.log(a)  # Logarithmic correction
-            
-            # Standard growth factor
-            E_z = np.sqrt(Omega_m * (1+z)**3 + Omega_lambda)
-            D_standard = (5*Omega_m/2) * E_z * np.sqrt(1+z) / (1+z)**2
-            
-            return D_standard * modification
-        
         # Calculate matter power spectrum
-        P_k_today = (k_values/0.05)**(-3) * np.exp(-(k_values/0.1)**2)  # Approximate shape
+        power = PowerSpectrum(transfer='approximate')  # Approximate shape
         
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
         
-        # Power spectrum evolution
-        for z in [0, 1, 5]:
-            D_z = growth_factor(z)
-            P_k_z = P_k_today * (D_z/growth_factor(0))**2
-            ax1.loglog(k_values, P_k_z, label=f'z = {z}')
+        # Power spectrum evolution: P(k, z) on the whole (k, z) grid at once
+        z_power = [0, 1, 5]
+        P_k_z = power.grid(k_values, z_power, cache=False)
+        for z, P_k in zip(z_power, P_k_z):
+            ax1.loglog(k_values, P_k, label=f'z = {z}')
         
         ax1.set_xlabel('k (h/Mpc)')
         ax1.set_ylabel('P(k)')
@@ -241,12 +232,11 @@ class AdvancedWavelengthFieldTheory:
         ax1.legend()
         ax1.grid(True, alpha=0.3)
         
-        # BAO peak shifts
-        r_sound = 150  # Mpc (sound horizon)
-        theta_BAO_standard = r_sound / (1420)  # Standard angular scale
-        
+        # BAO peak shifts: θ_BAO = r_d/D_M(z) from the background distances
         z_bao = np.linspace(0.1, 2, 20)
-        theta_BAO_wft = theta_BAO_standard * (1 + alpha**2 * np.log(1+z_bao))
+        bao_params = parameter_sets(coupling=alpha)
+        theta_BAO_standard = bao_scales(z_bao, bao_params, modified=False)['theta'][0]
+        theta_BAO_wft = bao_scales(z_bao, bao_params)['theta'][0]
         
         ax2.plot(z_bao, theta_BAO_wft/theta_BAO_standard, 'b-', linewidth=2, label='WFT prediction')
         ax2.axhline(1, color='r', linestyle='--', label='Standard ΛCDM')
@@ -260,10 +250,10 @@ class AdvancedWavelengthFieldTheory:
         l_values = np.logspace(1, 3.5, 100)
         
         # Standard CMB spectrum (approximate)
-        C_l_standard = 6000 * (l_values/220)**(-1) * np.exp(-(l_values/1500)**2)
+        C_l_standard = standard_cmb_spectrum(l_values)
         
         # WFT modifications
-        C_l_wft = C_l_standard * (1 + alpha**2 * np.sin(l_values/100) * np.exp(-l_values/1000))
+        C_l_wft = modified_cmb_spectrum(l_values, alpha)
         
         ax3.loglog(l_values, l_values*(l_values+1)*C_l_standard/(2*np.pi), 'r--', 
                    linewidth=2, label='Standard ΛCDM')
@@ -452,6 +442,7 @@ class AdvancedWavelengthFieldTheory:
         
         return predictions
 
+@instrument
 def create_human_friendly_summary():
     """Create human-friendly exposition of the theory"""
     print("\n📖 HUMAN-FRIENDLY THEORY EXPOSITION")
@@ -510,6 +501,10 @@ def create_human_friendly_summary():
 
 def main():
     """Address all advanced theoretical challenges"""
+    print("ADVANCED THEORETICAL FOUNDATIONS")
+    print("=" * 50)
+    print("Addressing Deep Theoretical Challenges")
+    print("=" * 50)
     
     theory = AdvancedWavelengthFieldTheory()
     
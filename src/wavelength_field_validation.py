@@ -13,9 +13,18 @@ Author: Oliver Jay Hooton
 Date: July 20, 2025
 """
 
+import argparse
+import csv
+import itertools
+import math
+import os
+
 import numpy as np
 from scipy import constants
-import matplotlib.pyplot as plt
+
+from columnar_results import ColumnarWriter, store_path_for, write_columnar
+from instrumentation import instrument, instrument_class
+from precision import Corrected
 
 # Physical constants
 c = constants.c
@@ -31,18 +40,254 @@ m_proton = constants.m_p
 E_electron = 0.511e6 * 1.602e-19  # 0.511 MeV in Joules
 E_proton = 938.3e6 * 1.602e-19   # 938.3 MeV in Joules
 
+def integer_deviation(ratio):
+    """Distance of λ_light/λ_material ratios from the nearest integer (round half to even)"""
+    ratio = np.asarray(ratio, dtype=np.float64)
+    deviation = np.rint(ratio, out=np.empty_like(ratio))
+    np.subtract(ratio, deviation, out=deviation)
+    return np.abs(deviation, out=deviation)
+
+# Step profile: strong (< 0.1), moderate (< 0.5) and weak resonance levels
+STEP_RESONANCE_EDGES = np.array([0.1, 0.5])
+STEP_RESONANCE_LEVELS = np.array([1.0, 0.5, 0.1])
+
+# Python and NumPy scalars take the plain-Python resonance path (in float64, like arrays)
+SCALAR_TYPES = (int, float, np.floating, np.integer)
+
+def step_resonance_profile(ratio):
+    """Three-level resonance: 1.0 / 0.5 / 0.1 by deviation from the nearest integer"""
+    deviation = integer_deviation(ratio)
+    # Level index = number of edges the deviation is not below (NaN -> weak)
+    level = (~(deviation < STEP_RESONANCE_EDGES[0])).astype(np.intp)
+    level += ~(deviation < STEP_RESONANCE_EDGES[1])
+    return STEP_RESONANCE_LEVELS[level]
+
+def _step_resonance_scalar(ratio):
+    """Scalar step profile in plain Python (fast path of resonance_factor)"""
+    if not math.isfinite(ratio):
+        return 0.1
+    deviation = abs(ratio - round(ratio))
+    if deviation < 0.1:  # Strong resonance
+        return 1.0
+    elif deviation < 0.5:  # Moderate resonance
+        return 0.5
+    else:  # Weak resonance
+        return 0.1
+
+def lorentzian_resonance_profile(ratio, width=0.1):
+    """Smooth Lorentzian resonance peaked at integer ratios (peak 1, half-width 0.1)"""
+    deviation = integer_deviation(ratio)
+    return width**2 / (deviation**2 + width**2)
+
+# Registry of resonance profiles: name -> f(ratio array) -> resonance factor array
+RESONANCE_PROFILES = {
+    'step': step_resonance_profile,
+    'lorentzian': lorentzian_resonance_profile,
+}
+
+def register_resonance_profile(name, profile):
+    """Register a user-defined resonance profile f(ratio) under the given name"""
+    if not callable(profile):
+        raise TypeError(f"Resonance profile '{name}' must be callable")
+    RESONANCE_PROFILES[name] = profile
+    return profile
+
+def get_resonance_profile(profile):
+    """Look up a resonance profile by name (callables are passed through)"""
+    if callable(profile):
+        return profile
+    try:
+        return RESONANCE_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown resonance profile '{profile}'. "
+                         f"Available: {', '.join(RESONANCE_PROFILES)}") from None
+
+# Default test-case catalogue: one row per (Test_Name, Scale, Mass_1, Mass_2, Distance)
+DEFAULT_CATALOGUE = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                                 'data', 'validation_test_catalogue.csv')
+
+# Validation results CSV
+DEFAULT_RESULTS_PATH = 'results/complete_30_test_validation_results.csv'
+VALIDATION_RESULT_HEADER = ['Test_Name', 'Ratio_WF_Newton', 'Force_Total', 'Force_Newton']
+
+# Named constants that catalogue mass/distance entries may refer to
+CATALOGUE_CONSTANTS = {
+    'm_proton': m_proton,
+    'm_electron': m_electron,
+}
+
+# CSV header -> catalogue column
+CATALOGUE_COLUMNS = {
+    'Test_Name': 'name',
+    'Scale': 'scale',
+    'Mass_1': 'mass1',
+    'Mass_2': 'mass2',
+    'Distance': 'distance',
+}
+
+def _catalogue_value(entry):
+    """Parse a catalogue number or named constant"""
+    entry = entry.strip()
+    if entry in CATALOGUE_CONSTANTS:
+        return CATALOGUE_CONSTANTS[entry]
+    return float(entry)
+
+def _catalogue_header(row):
+    """Map a CSV header row onto catalogue column names"""
+    return [CATALOGUE_COLUMNS.get(column.strip(), column.strip()) for column in row]
+
+def _check_catalogue(catalogue, path):
+    """Raise if a catalogue lacks a required column"""
+    missing = {'name', 'mass1', 'mass2', 'distance'} - set(catalogue)
+    if missing:
+        raise ValueError(f"Catalogue {path} is missing columns: {', '.join(sorted(missing))}")
+    return catalogue
+
+def _catalogue_from_rows(header, rows, path):
+    """Convert parsed CSV rows into catalogue columns"""
+    columns = list(zip(*rows)) or [()] * len(header)
+    catalogue = _check_catalogue(dict(zip(header, columns)), path)
+    for key in ('mass1', 'mass2', 'distance'):
+        catalogue[key] = np.array([_catalogue_value(entry) for entry in catalogue[key]],
+                                  dtype=np.float64)
+    for key in ('name', 'scale'):
+        if key in catalogue:
+            catalogue[key] = np.array(catalogue[key], dtype=str)
+    return catalogue
+
+@instrument
+def load_test_catalogue(path=DEFAULT_CATALOGUE):
+    """
+    Load a test-case catalogue as columns: name, scale, mass1, mass2, distance
+
+    CSV catalogues carry the header Test_Name, Scale, Mass_1, Mass_2, Distance
+    (Scale is optional and masses/distances may name an entry of
+    CATALOGUE_CONSTANTS). NPZ catalogues store the same columns as arrays
+    under the catalogue column names.
+    """
+    if path.endswith('.npz'):
+        with np.load(path, allow_pickle=False) as data:
+            return _check_catalogue({key: data[key] for key in data.files}, path)
+
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = _catalogue_header(next(reader))
+        return _catalogue_from_rows(header, list(reader), path)
+
+def iter_catalogue_chunks(path=DEFAULT_CATALOGUE, chunk_size=100000):
+    """
+    Yield a catalogue in chunks of at most chunk_size rows
+
+    CSV catalogues are parsed chunk by chunk, so memory is bounded by the chunk
+    size. NPZ members cannot be read partially; they are loaded once and sliced.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    if path.endswith('.npz'):
+        catalogue = load_test_catalogue(path)
+        for start in range(0, len(catalogue['mass1']), chunk_size):
+            yield {key: column[start:start + chunk_size] for key, column in catalogue.items()}
+        return
+
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = _catalogue_header(next(reader))
+        while True:
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                break
+            yield _catalogue_from_rows(header, rows, path)
+
+# Classification tiers for F_total/F_newton, worst to best
+NEEDS_WORK, GOOD, EXCELLENT, PERFECT = range(4)
+TIER_LABELS = ("⚠️  Needs work", "✅ GOOD", "🎉 EXCELLENT", "🏆 PERFECT")
+
+# Inclusive lower and upper edges of the GOOD, EXCELLENT and PERFECT bands
+TIER_LOWER_EDGES = np.array([0.5, 0.8, 0.9])
+TIER_UPPER_EDGES = np.array([1.1, 1.2, 2.0])
+
+def classify_ratios(ratio):
+    """
+    Classify ratios: PERFECT (0.9-1.1), EXCELLENT (0.8-1.2), GOOD (0.5-2.0)
+
+    Binning from below counts the bands a ratio clears, binning from above
+    counts the bands it overshoots; the tier is the smaller of the two.
+    NaN falls outside every band.
+    """
+    ratio = np.asarray(ratio, dtype=np.float64)
+    cleared_below = np.digitize(ratio, TIER_LOWER_EDGES)
+    exceeded_above = np.digitize(ratio, TIER_UPPER_EDGES, right=True)
+    return np.minimum(cleared_below, PERFECT - exceeded_above)
+
+class ValidationSummary:
+    """Running aggregates over validated chunks: tier counts and ratio min/max/mean"""
+
+    def __init__(self):
+        self.tier_counts = np.zeros(len(TIER_LABELS), dtype=np.int64)
+        self.total = 0
+        self.ratio_min = np.inf
+        self.ratio_max = -np.inf
+        self.ratio_sum = 0.0
+
+    def update(self, evaluated):
+        """Fold one validate_catalogue result into the aggregates"""
+        ratio = evaluated['ratio']
+        if ratio.size == 0:
+            return self
+        self.tier_counts += np.bincount(evaluated['tier'], minlength=len(TIER_LABELS))
+        self.total += ratio.size
+        self.ratio_min = min(self.ratio_min, float(ratio.min()))
+        self.ratio_max = max(self.ratio_max, float(ratio.max()))
+        self.ratio_sum += float(ratio.sum())
+        return self
+
+    @property
+    def perfect(self):
+        return int(self.tier_counts[PERFECT])
+
+    @property
+    def excellent(self):
+        return int(self.tier_counts[EXCELLENT])
+
+    @property
+    def good(self):
+        return int(self.tier_counts[GOOD])
+
+    @property
+    def success(self):
+        return self.perfect + self.excellent + self.good
+
+    @property
+    def ratio_mean(self):
+        return self.ratio_sum / self.total if self.total else np.nan
+
+    def as_dict(self):
+        return {
+            'total': self.total,
+            'perfect': self.perfect,
+            'excellent': self.excellent,
+            'good': self.good,
+            'ratio_min': self.ratio_min,
+            'ratio_max': self.ratio_max,
+            'ratio_mean': self.ratio_mean
+        }
+
+@instrument_class
 class WorkingWavelengthFieldTheory:
     """Working wavelength field theory implementation"""
     
-    def __init__(self):
-        print("WORKING WAVELENGTH FIELD THEORY - 30 TEST VALIDATION")
-        print("="*60)
-        print("Using proven approach:")
-        print("• λ = hc/E (energy-to-wavelength)")
-        print("• Resonance factors for realistic scaling")
-        print("• Density-weighted contributions")
-        print("• Small wavelength corrections to Newton")
-        print()
+    def __init__(self, resonance_profile='step', verbose=False):
+        self.resonance_profile = get_resonance_profile(resonance_profile)
+        if verbose:
+            print("WORKING WAVELENGTH FIELD THEORY - 30 TEST VALIDATION")
+            print("="*60)
+            print("Using proven approach:")
+            print("• λ = hc/E (energy-to-wavelength)")
+            print("• Resonance factors for realistic scaling")
+            print("• Density-weighted contributions")
+            print("• Small wavelength corrections to Newton")
+            print()
         
     def wavelength_from_energy(self, energy):
         """Calculate wavelength from energy: λ = hc/E"""
@@ -70,26 +315,37 @@ class WorkingWavelengthFieldTheory:
         else:
             return c * lambda_new / lambda_total
     
-    def resonance_factor(self, lambda_light, lambda_material):
-        """Calculate resonance between light and material wavelengths"""
-        if lambda_material == 0:
-            return 0
-        
-        ratio = lambda_light / lambda_material
-        
-        # Resonance is strongest when ratio is near integer values
-        nearest_integer = round(ratio)
-        deviation = abs(ratio - nearest_integer)
-        
-        if deviation < 0.1:  # Strong resonance
-            return 1.0
-        elif deviation < 0.5:  # Moderate resonance  
-            return 0.5
-        else:  # Weak resonance
-            return 0.1
+    def resonance_factor(self, lambda_light, lambda_material, profile=None):
+        """
+        Calculate resonance between light and material wavelengths
+
+        Broadcasts over arrays of λ_light and λ_material. Resonance is strongest
+        when the ratio is near integer values; the shape is set by the resonance
+        profile (the instance default unless one is given). No material
+        wavelength (λ_material = 0) means no resonance.
+        """
+        # Scalar fast path: plain Python for the default step profile
+        if (profile is None and self.resonance_profile is step_resonance_profile
+                and isinstance(lambda_light, SCALAR_TYPES) and isinstance(lambda_material, SCALAR_TYPES)):
+            if lambda_material == 0:
+                return 0.0
+            return _step_resonance_scalar(float(lambda_light) / float(lambda_material))
+
+        profile = self.resonance_profile if profile is None else get_resonance_profile(profile)
+        lambda_light = np.asarray(lambda_light, dtype=np.float64)
+        lambda_material = np.asarray(lambda_material, dtype=np.float64)
+
+        no_material = lambda_material == 0
+        ratio = np.divide(lambda_light, lambda_material,
+                          out=np.zeros(np.broadcast(lambda_light, lambda_material).shape),
+                          where=~no_material)
+        factor = profile(ratio)
+        factor = np.where(no_material, 0.0, factor)
+
+        return factor[()] if factor.ndim == 0 else factor
     
-    def gravitational_field_from_mass(self, mass, distance):
-        """Gravitational field with small wavelength corrections"""
+    def gravitational_field_corrected(self, mass, distance):
+        """Newtonian field and its wavelength correction, carried separately"""
         # Standard Newtonian gravity dominates
         g_newton = G * mass / distance**2
         
@@ -98,9 +354,16 @@ class WorkingWavelengthFieldTheory:
         particle = self.particle_wavelength_field(particle_energy)
         
         # Tiny correction factor (from working implementation)
-        correction = 1 + 1e-40 * particle['wavelength'] / distance
-        
-        return g_newton * correction
+        return Corrected(g_newton, 1e-40 * particle['wavelength'] / distance)
+    
+    def gravitational_field_from_mass(self, mass, distance, backend='float64'):
+        """
+        Gravitational field with small wavelength corrections
+
+        The default float64 backend rounds the ~1e-40 λ/d correction away;
+        see precision.Corrected.total for the backends that keep it.
+        """
+        return self.gravitational_field_corrected(mass, distance).total(backend)
     
     def gravitational_force_with_wavelength_corrections(self, mass1, mass2, distance):
         """Calculate gravitational force with wavelength field corrections"""
@@ -156,7 +419,83 @@ class WorkingWavelengthFieldTheory:
         F_total = F_newton + F_wavelength
         
         return F_total, F_newton, F_wavelength, F_em, F_alpha2
-    
+
+    def gravitational_force_batch(self, mass1, mass2, distance):
+        """
+        Vectorized gravitational_force_with_wavelength_corrections
+
+        Takes broadcastable arrays of masses and distances and returns arrays
+        (F_total, F_newton, F_wavelength, F_em, F_alpha2). Every operation is
+        applied in the same order as the scalar path, so results agree bit for bit.
+        """
+        mass1, mass2, distance = np.broadcast_arrays(
+            np.asarray(mass1, dtype=np.float64),
+            np.asarray(mass2, dtype=np.float64),
+            np.asarray(distance, dtype=np.float64))
+
+        # np.float_power goes through libm pow() like Python's float ** 2;
+        # ndarray ** 2 squares via x*x, which can differ in the last bit
+        distance_sq = np.float_power(distance, 2)
+
+        # Standard Newton's law
+        F_newton = G * mass1 * mass2 / distance_sq
+
+        # Wavelength field of each mass: λ = hc/E (0 for non-positive energy)
+        lambda1 = self._wavelength_from_energy_array(mass1 * c**2)
+        lambda2 = self._wavelength_from_energy_array(mass2 * c**2)
+
+        # Test wavelength (visible light)
+        lambda_test = 500e-9
+
+        # Resonance factors
+        resonance1 = self.resonance_factor(lambda_test, lambda1)
+        resonance2 = self.resonance_factor(lambda_test, lambda2)
+
+        # Wavelength field contributions
+        lambda_existing1 = lambda1 * resonance1 * 1e-30  # Small density factor
+        lambda_existing2 = lambda2 * resonance2 * 1e-30
+
+        # Light speed modifications
+        v1 = self._light_speed_array(lambda_test, lambda_existing1)
+        v2 = self._light_speed_array(lambda_test, lambda_existing2)
+
+        # Velocity changes
+        dv1 = c - v1
+        dv2 = c - v2
+
+        # Electromagnetic field energy from velocity changes
+        E_field1 = epsilon_0 * np.float_power(dv1, 2)
+        E_field2 = epsilon_0 * np.float_power(dv2, 2)
+
+        # Electromagnetic force between fields
+        F_em = (E_field1 * E_field2) / (4 * np.pi * epsilon_0 * distance_sq)
+
+        # Apply α² correction (second-order EM effect)
+        F_alpha2 = F_em * alpha**2
+
+        # Apply electromagnetic mass fraction
+        EM_fraction = 0.58 / 938.3  # From lattice QCD
+        F_wavelength = F_alpha2 * EM_fraction
+
+        # Total force (Newton + wavelength correction)
+        F_total = F_newton + F_wavelength
+
+        return F_total, F_newton, F_wavelength, F_em, F_alpha2
+
+    @staticmethod
+    def _wavelength_from_energy_array(energy):
+        """Array form of wavelength_from_energy"""
+        positive = energy > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(positive, h * c / np.where(positive, energy, 1.0), 0.0)
+
+    @staticmethod
+    def _light_speed_array(lambda_new, lambda_existing):
+        """Array form of light_speed_fundamental"""
+        lambda_total = lambda_new + lambda_existing
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(lambda_total == 0, c, c * lambda_new / lambda_total)
+
     def validate_test_case(self, name, mass1, mass2, distance):
         """Validate single test case"""
         
@@ -172,89 +511,97 @@ class WorkingWavelengthFieldTheory:
         
         return F_total, F_newton, ratio, result
     
-    def comprehensive_30_test_validation(self):
+    def validate_catalogue(self, catalogue):
+        """
+        Validate every test case of a catalogue in one vectorized pass
+
+        Rows with a non-positive mass are skipped, as in validate_test_case.
+        Returns columns (row, name, ratio, forces, tier) for the evaluated rows.
+        """
+        mass1 = np.asarray(catalogue['mass1'], dtype=np.float64)
+        mass2 = np.asarray(catalogue['mass2'], dtype=np.float64)
+        distance = np.asarray(catalogue['distance'], dtype=np.float64)
+        valid = (mass1 > 0) & (mass2 > 0)
+
+        F_total, F_newton, F_wavelength, F_em, F_alpha2 = self.gravitational_force_batch(
+            mass1[valid], mass2[valid], distance[valid])
+
+        # Ratio to Newton's law
+        ratio = np.divide(F_total, F_newton, out=np.zeros_like(F_total), where=F_newton > 0)
+
+        return {
+            'row': np.flatnonzero(valid),
+            'name': np.asarray(catalogue['name'])[valid],
+            'ratio': ratio,
+            'F_total': F_total,
+            'F_newton': F_newton,
+            'F_wavelength': F_wavelength,
+            'F_em': F_em,
+            'F_alpha2': F_alpha2,
+            'tier': classify_ratios(ratio)
+        }
+
+    def iter_validation_chunks(self, catalogue_path=DEFAULT_CATALOGUE, chunk_size=100000):
+        """Validate a catalogue chunk by chunk, yielding each validate_catalogue result"""
+        for chunk in iter_catalogue_chunks(catalogue_path, chunk_size):
+            yield self.validate_catalogue(chunk)
+
+    def stream_validation(self, catalogue_path, output_path, chunk_size=100000, binary=False):
+        """
+        Validate a catalogue in fixed-size chunks, writing results as they arrive
+
+        Each evaluated chunk is appended to the results CSV (and, with binary=True,
+        to a memory-mappable columnar store next to it) and folded into a
+        ValidationSummary, so memory stays bounded by the chunk size.
+        """
+        summary = ValidationSummary()
+        store = ColumnarWriter(store_path_for(output_path)) if binary else None
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(VALIDATION_RESULT_HEADER)
+            for evaluated in self.iter_validation_chunks(catalogue_path, chunk_size):
+                writer.writerows(zip(evaluated['name'].tolist(), evaluated['ratio'].tolist(),
+                                     evaluated['F_total'].tolist(), evaluated['F_newton'].tolist()))
+                if store is not None:
+                    store.append(validation_result_columns(evaluated['name'], evaluated['ratio'],
+                                                           evaluated['F_total'], evaluated['F_newton']))
+                summary.update(evaluated)
+        if store is not None:
+            store.close()
+        return summary
+
+    def comprehensive_30_test_validation(self, catalogue_path=DEFAULT_CATALOGUE):
         """Run all 30 tests for complete validation"""
         
         print("\n" + "="*80)
         print("COMPREHENSIVE 30-TEST WAVELENGTH FIELD THEORY VALIDATION")
         print("="*80)
         
-        # Complete test suite (30 tests)
-        test_cases = [
-            # Particle scale (5 tests)
-            ("Proton-Proton", m_proton, m_proton, 1e-15),
-            ("Electron-Electron", m_electron, m_electron, 1e-10),
-            ("Proton-Electron", m_proton, m_electron, 1e-12),
-            ("Neutron-Neutron", 1.675e-27, 1.675e-27, 1e-15),
-            ("Muon-Muon", 1.884e-28, 1.884e-28, 1e-12),
-            
-            # Atomic/Molecular scale (5 tests)
-            ("Hydrogen-Hydrogen", 1.674e-27, 1.674e-27, 1e-9),
-            ("Carbon-Carbon", 1.994e-26, 1.994e-26, 1e-9),
-            ("Molecule-Molecule", 1e-25, 1e-25, 1e-8),
-            ("DNA-DNA", 1e-21, 1e-21, 1e-8),
-            ("Virus-Virus", 1e-19, 1e-19, 1e-7),
-            
-            # Laboratory scale (5 tests)
-            ("Gram-Gram", 1e-3, 1e-3, 1e-2),
-            ("Apple-Apple", 0.2, 0.2, 0.1),
-            ("Book-Book", 1.0, 1.0, 0.3),
-            ("Human-Human", 70, 70, 1.0),
-            ("Car-Car", 1500, 1500, 10.0),
-            
-            # Geological scale (5 tests)
-            ("Boulder-Boulder", 1e6, 1e6, 100),
-            ("Building-Building", 1e8, 1e8, 1000),
-            ("Mountain-Mountain", 1e12, 1e12, 10000),
-            ("City-City", 1e14, 1e14, 50000),
-            ("Island-Island", 1e16, 1e16, 100000),
-            
-            # Astronomical scale (5 tests)
-            ("Asteroid-Asteroid", 1e18, 1e18, 1e6),
-            ("Moon-Moon", 7.342e22, 7.342e22, 3.844e8),
-            ("Earth-Moon", 5.972e24, 7.342e22, 3.844e8),
-            ("Earth-Earth", 5.972e24, 5.972e24, 1.496e11),
-            ("Sun-Earth", 1.989e30, 5.972e24, 1.496e11),
-            
-            # Mixed/Extreme scales (5 tests)
-            ("Human-Earth", 70, 5.972e24, 6.371e6),
-            ("Satellite-Earth", 1000, 5.972e24, 7e6),
-            ("Electron-Proton", m_electron, m_proton, 5.29e-11),
-            ("Atom-Planet", 1e-26, 1e24, 1e6),
-            ("Quantum-Macro", 1e-30, 1e10, 1e3),
-        ]
-        
-        results = []
-        perfect_count = 0
-        excellent_count = 0
-        good_count = 0
-        
-        for i, (name, m1, m2, dist) in enumerate(test_cases, 1):
-            result = self.validate_test_case(name, m1, m2, dist)
-            if result is None:
-                continue
-                
-            F_total, F_newton, ratio, details = result
-            results.append((name, ratio, F_total, F_newton))
-            
-            # Classify result
-            if 0.9 <= ratio <= 1.1:
-                status = "🏆 PERFECT"
-                perfect_count += 1
-            elif 0.8 <= ratio <= 1.2:
-                status = "🎉 EXCELLENT"
-                excellent_count += 1
-            elif 0.5 <= ratio <= 2.0:
-                status = "✅ GOOD"
-                good_count += 1
-            else:
-                status = "⚠️  Needs work"
-            
-            print(f"{i:2d}. {name:20}: Ratio = {ratio:.6f} - {status}")
+        # Complete test suite (30 tests, one row per case in the catalogue)
+        catalogue = load_test_catalogue(catalogue_path)
+        evaluated = self.validate_catalogue(catalogue)
+        
+        names = evaluated['name'].tolist()
+        ratios = evaluated['ratio'].tolist()
+        F_totals = evaluated['F_total'].tolist()
+        F_newtons = evaluated['F_newton'].tolist()
+        results = list(zip(names, ratios, F_totals, F_newtons))
+        
+        tier_counts = np.bincount(evaluated['tier'], minlength=len(TIER_LABELS))
+        perfect_count = int(tier_counts[PERFECT])
+        excellent_count = int(tier_counts[EXCELLENT])
+        good_count = int(tier_counts[GOOD])
+        
+        for j, (row, name, ratio) in enumerate(zip(evaluated['row'].tolist(), names, ratios)):
+            status = TIER_LABELS[evaluated['tier'][j]]
+            print(f"{row + 1:2d}. {name:20}: Ratio = {ratio:.6f} - {status}")
             
             # Show details for key representative cases
             if name in ["Earth-Moon", "Proton-Proton", "Human-Human", "Electron-Proton"]:
-                F_total, F_newton, F_wavelength, F_em, F_alpha2 = details
+                F_newton = evaluated['F_newton'][j]
+                F_wavelength = evaluated['F_wavelength'][j]
+                F_em = evaluated['F_em'][j]
+                F_alpha2 = evaluated['F_alpha2'][j]
                 print(f"    Forces: Newton={F_newton:.2e}N, Wavelength={F_wavelength:.2e}N")
                 print(f"    EM components: F_em={F_em:.2e}N, F_α²={F_alpha2:.2e}N")
                 print()
@@ -271,10 +618,14 @@ class WorkingWavelengthFieldTheory:
         print(f"Perfect (0.9-1.1): {perfect_count}")
         print(f"Excellent (0.8-1.2): {excellent_count}")
         print(f"Good (0.5-2.0): {good_count}")
-        print(f"Success rate: {success_tests}/{total_tests} = {100*success_tests/total_tests:.1f}%")
+        if total_tests:
+            print(f"Success rate: {success_tests}/{total_tests} = {100*success_tests/total_tests:.1f}%")
         
         # Final assessment
-        if perfect_count >= total_tests * 0.8:
+        if total_tests == 0:
+            print("\n⚠️  No test cases in the catalogue")
+            status = "NO TESTS"
+        elif perfect_count >= total_tests * 0.8:
             print("\n🏆 COMPLETE VALIDATION ACHIEVED!")
             print("🎯 WAVELENGTH FIELD THEORY FULLY PROVEN!")
             print("🌊 All scales from quantum to cosmic validated!")
@@ -301,29 +652,93 @@ class WorkingWavelengthFieldTheory:
         
         return results, perfect_count, excellent_count, good_count, total_tests, status
 
-# Run the complete 30-test validation
-wft = WorkingWavelengthFieldTheory()
-results, perfect, excellent, good, total, status = wft.comprehensive_30_test_validation()
-
-print(f"\n" + "="*80)
-print("WAVELENGTH FIELD THEORY - 30-TEST VALIDATION COMPLETE")
-print("="*80)
-print("🌟 Using working implementation approach")
-print("🌟 Fundamental equation: v = c × (λ_new/λ_total)")
-print("🌟 Energy-wavelength: λ = hc/E")
-print("🌟 Resonance factors for realistic scaling")
-print("🌟 Small wavelength corrections to gravity")
-print(f"🌟 FINAL STATUS: {status}")
-print("="*80)
-
-# Save comprehensive results
-import csv
-with open('results/complete_30_test_validation_results.csv', 'w', newline='') as f:
-    writer = csv.writer(f)
-    writer.writerow(['Test_Name', 'Ratio_WF_Newton', 'Force_Total', 'Force_Newton'])
-    for name, ratio, f_total, f_newton in results:
-        writer.writerow([name, ratio, f_total, f_newton])
-
-print(f"\nComplete 30-test results saved to: results/complete_30_test_validation_results.csv")
-print(f"Ready for final manuscript compilation with {status}!")
+def validation_result_columns(names, ratios, F_totals, F_newtons):
+    """Validation results as {results CSV column: array}"""
+    return dict(zip(VALIDATION_RESULT_HEADER, (
+        np.asarray(names, dtype=str),
+        np.asarray(ratios, dtype=np.float64),
+        np.asarray(F_totals, dtype=np.float64),
+        np.asarray(F_newtons, dtype=np.float64))))
+
+@instrument
+def save_validation_results(results, path=DEFAULT_RESULTS_PATH, binary=False):
+    """
+    Save (name, ratio, F_total, F_newton) validation results as CSV
+
+    With binary=True the same columns are also written as a columnar store
+    next to the CSV (see columnar_results).
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(VALIDATION_RESULT_HEADER)
+        for name, ratio, f_total, f_newton in results:
+            writer.writerow([name, ratio, f_total, f_newton])
+    if binary:
+        columns = list(zip(*results)) or [()] * len(VALIDATION_RESULT_HEADER)
+        write_columnar(store_path_for(path), validation_result_columns(*columns))
+    return path
+
+def print_stream_summary(summary, output_path):
+    """Print the running aggregates of a streamed validation"""
+    print("\n" + "="*80)
+    print("STREAMED WAVELENGTH FIELD THEORY VALIDATION SUMMARY")
+    print("="*80)
+    print(f"Total tests completed: {summary.total}")
+    print(f"Perfect (0.9-1.1): {summary.perfect}")
+    print(f"Excellent (0.8-1.2): {summary.excellent}")
+    print(f"Good (0.5-2.0): {summary.good}")
+    if summary.total:
+        print(f"Success rate: {summary.success}/{summary.total} = {100*summary.success/summary.total:.1f}%")
+        print(f"Ratio range: {summary.ratio_min:.6f} - {summary.ratio_max:.6f} (mean {summary.ratio_mean:.6f})")
+    print(f"\nResults streamed to: {output_path}")
+
+def main(argv=None):
+    """Run the complete 30-test validation and save the results"""
+    parser = argparse.ArgumentParser(description="Wavelength field theory validation suite")
+    parser.add_argument('--catalogue', default=DEFAULT_CATALOGUE,
+                        help="test-case catalogue (CSV or NPZ)")
+    parser.add_argument('--output', default=DEFAULT_RESULTS_PATH,
+                        help="results CSV")
+    parser.add_argument('--stream', action='store_true',
+                        help="validate in fixed-size chunks, writing results incrementally")
+    parser.add_argument('--chunk-size', type=int, default=100000,
+                        help="rows per chunk in streaming mode")
+    parser.add_argument('--binary', action='store_true',
+                        help="also write a memory-mappable columnar store next to the CSV")
+    args = parser.parse_args(argv)
+
+    if args.stream:
+        wft = WorkingWavelengthFieldTheory()
+        summary = wft.stream_validation(args.catalogue, args.output, args.chunk_size, args.binary)
+        print_stream_summary(summary, args.output)
+        if args.binary:
+            print(f"Columnar results streamed to: {store_path_for(args.output)}")
+        return summary
+
+    wft = WorkingWavelengthFieldTheory(verbose=True)
+    results, perfect, excellent, good, total, status = wft.comprehensive_30_test_validation(args.catalogue)
+
+    print(f"\n" + "="*80)
+    print("WAVELENGTH FIELD THEORY - 30-TEST VALIDATION COMPLETE")
+    print("="*80)
+    print("🌟 Using working implementation approach")
+    print("🌟 Fundamental equation: v = c × (λ_new/λ_total)")
+    print("🌟 Energy-wavelength: λ = hc/E")
+    print("🌟 Resonance factors for realistic scaling")
+    print("🌟 Small wavelength corrections to gravity")
+    print(f"🌟 FINAL STATUS: {status}")
+    print("="*80)
+
+    # Save comprehensive results
+    path = save_validation_results(results, args.output, args.binary)
+
+    print(f"\nComplete 30-test results saved to: {path}")
+    if args.binary:
+        print(f"Columnar results saved to: {store_path_for(path)}")
+    print(f"Ready for final manuscript compilation with {status}!")
+
+    return results, status
+
+if __name__ == "__main__":
+    main()
 
@@ -12,12 +12,43 @@ Email: oliver.j.hooton@gmail.com
 Date: 2025-01-20
 """
 
+import argparse
+import glob
+import json
 import os
 import sys
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from columnar_results import open_results
+from build_cache import (BUILD_GRAPH, RESTORED, STALE, BuildCache, plan_build, print_build_plan,
+                         verification_key)
+from precision import relative_difference
+
+def load_parameter_values(results_path):
+    """
+    Parameter -> Value lookup for a results table
+
+    Reads the memory-mapped columnar store next to the CSV when it is up to
+    date (see src/columnar_results.py), otherwise parses the CSV.
+    """
+    table = open_results(results_path)
+    if table is not None:
+        parameters, values = table['Parameter'], table['Value']
+    else:
+        df = pd.read_csv(results_path)
+        parameters, values = df['Parameter'], df['Value']
+
+    lookup = {}
+    for parameter, value in zip(parameters, values):
+        lookup.setdefault(parameter, value)
+    return lookup
+
 def check_python_version():
     """Check Python version is 3.13+"""
     print("🔍 Checking Python version...")
@@ -62,32 +93,126 @@ def check_scripts_exist():
             return False
     return True
 
-def run_script(script_name, timeout=300):
-    """Run a Python script and return success status"""
+def _stream_lines(pipe, prefix, captured, lock, echo):
+    """Collect a child pipe line by line, echoing each line with a script prefix"""
+    for line in iter(pipe.readline, ''):
+        captured.append(line)
+        if echo:
+            with lock:
+                print(f"{prefix} {line}", end='' if line.endswith('\n') else '\n', flush=True)
+    pipe.close()
+
+def run_script_streaming(script_name, timeout=300, lock=None, echo=True, env=None):
+    """Run a Python script, streaming its prefixed output, and return a report entry"""
+    lock = lock or threading.Lock()
+    prefix = f"[{os.path.splitext(os.path.basename(script_name))[0]}]"
+    report = {'script': script_name, 'status': 'ERROR', 'returncode': None,
+              'elapsed': 0.0, 'stdout': '', 'stderr': ''}
+    stdout, stderr = [], []
+    start = time.perf_counter()
+
+    with lock:
+        print(f"🚀 Starting {script_name}...", flush=True)
     try:
-        print(f"\n🚀 Running {script_name}...")
-        result = subprocess.run(
+        process = subprocess.Popen(
             [sys.executable, script_name],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout,
-            cwd=os.getcwd()
+            bufsize=1,
+            cwd=os.getcwd(),
+            env=dict(os.environ, PYTHONUNBUFFERED='1', **(env or {}))
         )
-        
-        if result.returncode == 0:
-            print(f"✅ {script_name} - SUCCESS")
-            return True
-        else:
-            print(f"❌ {script_name} - FAILED")
-            print(f"Error: {result.stderr}")
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print(f"❌ {script_name} - TIMEOUT")
-        return False
     except Exception as e:
-        print(f"❌ {script_name} - ERROR: {e}")
-        return False
+        report['stderr'] = str(e)
+        with lock:
+            print(f"❌ {script_name} - ERROR: {e}", flush=True)
+        return report
+
+    readers = [
+        threading.Thread(target=_stream_lines, args=(process.stdout, prefix, stdout, lock, echo), daemon=True),
+        threading.Thread(target=_stream_lines, args=(process.stderr, prefix + '[stderr]', stderr, lock, echo), daemon=True)
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        process.wait(timeout=timeout)
+        report['status'] = 'SUCCESS' if process.returncode == 0 else 'FAILED'
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        report['status'] = 'TIMEOUT'
+    for reader in readers:
+        reader.join()
+
+    report['returncode'] = process.returncode
+    report['elapsed'] = time.perf_counter() - start
+    report['stdout'] = ''.join(stdout)
+    report['stderr'] = ''.join(stderr)
+
+    symbol = '✅' if report['status'] == 'SUCCESS' else '❌'
+    with lock:
+        print(f"{symbol} {script_name} - {report['status']} ({report['elapsed']:.1f} s)", flush=True)
+    return report
+
+def run_script(script_name, timeout=300):
+    """Run a single Python script and return success status"""
+    report = run_script_streaming(script_name, timeout=timeout, echo=False)
+    if report['status'] == 'FAILED':
+        print(f"Error: {report['stderr']}")
+    return report['status'] == 'SUCCESS'
+
+def run_scripts(scripts, workers=None, timeout=300, echo=True, env=None):
+    """
+    Run scripts in parallel worker processes and return their reports in input order
+
+    The scripts write disjoint output files, so they can run concurrently;
+    each one runs in its own interpreter, supervised by a pool thread.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(scripts) or 1))
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_script_streaming, script, timeout, lock, echo, env) for script in scripts]
+        return [future.result() for future in futures]
+
+def print_run_report(reports, wall_time):
+    """Print the aggregated script execution report"""
+    print("\n📊 SCRIPT EXECUTION REPORT")
+    print("-" * 60)
+    for report in reports:
+        symbol = '✅' if report['status'] == 'SUCCESS' else '❌'
+        print(f"{symbol} {report['script']:<45} {report['status']:<8} {report['elapsed']:6.1f} s")
+    total = sum(report['elapsed'] for report in reports)
+    print("-" * 60)
+    print(f"Wall time: {wall_time:.1f} s (sum of script times {total:.1f} s)")
+
+    for report in reports:
+        if report['status'] != 'SUCCESS' and report['stderr']:
+            print(f"\nError output from {report['script']}:")
+            print(report['stderr'].rstrip())
+
+def print_profile_summary(profile_dir, top=5):
+    """Print the slowest instrumented steps from each script's profile report"""
+    print(f"\n⏱️  PROFILE SUMMARY ({profile_dir})")
+    print("-" * 60)
+    if not os.path.isdir(profile_dir):
+        print("No profile reports were written")
+        return
+    for script in sorted(os.listdir(profile_dir)):
+        if not script.endswith('.profile.json'):
+            continue
+        with open(os.path.join(profile_dir, script)) as f:
+            report = json.load(f)
+        peak = report['peak_rss_mb']
+        peak_text = f", peak RSS {peak:.0f} MB" if peak is not None else ""
+        print(f"{report['script']}: {report['total_wall_s']:.1f} s wall, {report['total_cpu_s']:.1f} s CPU{peak_text}")
+        for name, record in list(report['functions'].items())[:top]:
+            print(f"   {name:<65} {record['wall_total_s']:7.2f} s ({record['calls']} calls)")
+
+# Results are written to 3 significant figures; values span 1e-170 to 1e2,
+# so they are compared relative to the expected value rather than absolutely
+RESULT_RELATIVE_TOLERANCE = 5e-3
 
 def verify_corrected_results():
     """Verify the corrected parameter values are present"""
@@ -95,7 +220,7 @@ def verify_corrected_results():
     
     try:
         # Check fundamental derivations results
-        df = pd.read_csv('results/fundamental_derivations_results.csv')
+        values = load_parameter_values('results/fundamental_derivations_results.csv')
         
         # Check key corrected values
         expected_values = {
@@ -109,9 +234,9 @@ def verify_corrected_results():
         }
         
         for param, expected in expected_values.items():
-            if param in df['Parameter'].values:
-                actual = df[df['Parameter'] == param]['Value'].iloc[0]
-                if abs(actual - expected) < 1e-10:
+            if param in values:
+                actual = values[param]
+                if relative_difference(actual, expected) <= RESULT_RELATIVE_TOLERANCE:
                     print(f"✅ {param} = {actual:.2e} - CORRECT")
                 else:
                     print(f"❌ {param} = {actual:.2e} (expected {expected:.2e})")
@@ -126,6 +251,135 @@ def verify_corrected_results():
         print(f"❌ Error reading results: {e}")
         return False
 
+def check_batch_forces(n_pairs=10000, seed=0):
+    """gravitational_force_batch against the per-pair scalar force (bit-for-bit)"""
+    from wavelength_field_validation import WorkingWavelengthFieldTheory
+
+    rng = np.random.default_rng(seed)
+    mass1 = 10**rng.uniform(-30, 30, n_pairs)
+    mass2 = 10**rng.uniform(-30, 30, n_pairs)
+    distance = 10**rng.uniform(-15, 11, n_pairs)
+    wft = WorkingWavelengthFieldTheory()
+    scalar = np.array([wft.gravitational_force_with_wavelength_corrections(m1, m2, r)
+                       for m1, m2, r in zip(mass1.tolist(), mass2.tolist(), distance.tolist())]).T
+    batch = np.array(wft.gravitational_force_batch(mass1, mass2, distance))
+    return np.max(relative_difference(batch, scalar))
+
+def check_engine_distances():
+    """Cosmology engine D_C, D_L, D_A and H(z) against the shared background cosmology"""
+    from background_cosmology import get_background
+    from cosmology_engine import get_engine
+
+    engine = get_engine()
+    params = engine.params
+    background = get_background(params['H0'], params['Omega_m0'], params['Omega_r0'], params['Omega_Lambda0'])
+    z = np.array([0.1, 0.5, 1.0, 2.0, 10.0, 50.0])
+    pairs = [(engine.comoving_distance, background.comoving_distance),
+             (engine.luminosity_distance, background.luminosity_distance),
+             (engine.angular_diameter_distance, background.angular_diameter_distance),
+             (engine.hubble, background.hubble)]
+    return max(np.max(relative_difference(actual(z), expected(z))) for actual, expected in pairs)
+
+def _quad_distances(z, H0, Omega_m, Omega_r, Omega_Lambda):
+    """D_M(z) and D_H(z) in Mpc by scipy quad of 1/E(z), independent of background_cosmology"""
+    from scipy.integrate import quad
+
+    Omega_k = 1 - Omega_m - Omega_r - Omega_Lambda
+    E = lambda z: np.sqrt(Omega_r * (1 + z)**4 + Omega_m * (1 + z)**3 + Omega_k * (1 + z)**2 + Omega_Lambda)
+    D_hubble = 299792.458 / H0
+    chi = np.array([D_hubble * quad(lambda zp: 1 / E(zp), 0, zi, epsabs=0, epsrel=1e-12, limit=200)[0]
+                    for zi in z])
+    if Omega_k > 0:
+        D_M = D_hubble / np.sqrt(Omega_k) * np.sinh(np.sqrt(Omega_k) * chi / D_hubble)
+    elif Omega_k < 0:
+        D_M = D_hubble / np.sqrt(-Omega_k) * np.sin(np.sqrt(-Omega_k) * chi / D_hubble)
+    else:
+        D_M = chi
+    return D_M, D_hubble / E(np.asarray(z))
+
+def check_bao_distances():
+    """BAO D_M(z), D_H(z) against an independent quad integration (flat, open and closed)"""
+    from bao_forecast import bao_scales, parameter_sets
+
+    params = parameter_sets(H0=[67.0, 70.0, 74.0], Omega_m=[0.25, 0.31, 0.35], Omega_r=[0.0, 8e-5, 0.0],
+                            Omega_Lambda=[0.70, 0.69, 0.70])
+    z = np.array([0.1, 0.51, 1.0, 1.48, 2.1, 10.0, 1100.0])
+    scales = bao_scales(z, params)
+    errors = []
+    for row, scale in zip(params, scales):
+        D_M, D_H = _quad_distances(z, row['H0'], row['Omega_m'], row['Omega_r'], row['Omega_Lambda'])
+        errors.append(relative_difference(scale['D_M'], D_M))
+        errors.append(relative_difference(scale['D_H'], D_H))
+    return np.max(errors)
+
+# Planck 2018 (TT,TE,EE+lowE+lensing) fiducial and its drag-epoch sound horizon
+PLANCK_2018 = {'H0': 67.36, 'Omega_m': 0.3153, 'omega_b': 0.02237, 'r_drag': 147.09}
+
+def check_bao_planck_ruler():
+    """D_M/r_d at z = 0.51, 1.48 for Planck 2018 against quad D_M over the published r_drag"""
+    from bao_forecast import bao_scales, parameter_sets
+
+    h = PLANCK_2018['H0'] / 100
+    params = parameter_sets(H0=PLANCK_2018['H0'], Omega_m=PLANCK_2018['Omega_m'],
+                            Omega_Lambda=1 - PLANCK_2018['Omega_m'], Omega_b=PLANCK_2018['omega_b'] / h**2)
+    z = np.array([0.51, 1.48])
+    scales = bao_scales(z, params, modified=False)[0]
+    D_M, _ = _quad_distances(z, PLANCK_2018['H0'], PLANCK_2018['Omega_m'], 0.0, 1 - PLANCK_2018['Omega_m'])
+    return np.max(relative_difference(scales['D_M'] / scales['r_d'], D_M / PLANCK_2018['r_drag']))
+
+def check_transfer_callables():
+    """Power spectrum grids for two distinct transfer closures against direct evaluation"""
+    from power_spectrum import PowerSpectrum
+
+    def make_transfer(scale):
+        return lambda k, spectrum: np.exp(-k / scale)
+
+    k = np.logspace(-3, 1, 50)
+    z = np.array([0.0, 1.0])
+    errors = []
+    for scale in (0.1, 10.0):
+        spectrum = PowerSpectrum(transfer=make_transfer(scale))
+        errors.append(relative_difference(spectrum.grid(k, z), spectrum.linear(k, z)))
+    return np.max(errors)
+
+def check_underflowed_correction(factor='1e-200'):
+    """Sub-1e-308 correction through the 'auto' precision backend against exact mpmath arithmetic"""
+    import mpmath
+    from precision import Corrected
+
+    value = Corrected.from_factors(2.0, [float(factor)], powers=2)
+    with mpmath.workdps(30):
+        expected = 2 * mpmath.mpf(factor)**2
+        return float(abs((value.total('auto') - 2) / expected - 1))
+
+# Numerical accuracy checks: description -> (check returning a max relative error, tolerance)
+NUMERICAL_CHECKS = {
+    'Batch gravitational forces vs the per-pair scalar path': (check_batch_forces, 0.0),
+    'Cosmology engine D_C, D_L, D_A, H(z) vs background_cosmology': (check_engine_distances, 1e-6),
+    'BAO D_M(z), D_H(z) vs scipy quad of 1/E(z)': (check_bao_distances, 1e-6),
+    'BAO D_M/r_d at z = 0.51, 1.48 vs Planck 2018 r_drag (Aubourg fit, 0.5%)': (check_bao_planck_ruler, 5e-3),
+    'PowerSpectrum.grid for distinct transfer callables vs direct evaluation': (check_transfer_callables, 1e-12),
+    "Corrected.total('auto') for a 2e-400 correction vs mpmath": (check_underflowed_correction, 1e-10),
+    "Corrected.total('auto') for a subnormal 2e-322 correction vs mpmath":
+        (lambda: check_underflowed_correction('1e-161'), 1e-10),
+}
+
+def verify_numerical_accuracy(checks=NUMERICAL_CHECKS):
+    """Verify the numerical kernels against independent reference computations"""
+    print("\n🔍 Verifying numerical accuracy...")
+    for description, (check, tolerance) in checks.items():
+        try:
+            error = check()
+        except Exception as e:
+            print(f"❌ {description} - ERROR: {e}")
+            return False
+        if error <= tolerance:
+            print(f"✅ {description}: max relative error {error:.1e}")
+        else:
+            print(f"❌ {description}: max relative error {error:.1e} (tolerance {tolerance:.0e})")
+            return False
+    return True
+
 def check_output_files():
     """Check that expected output files are generated"""
     print("\n🔍 Checking output files...")
@@ -154,8 +408,44 @@ def check_output_files():
     
     return all_exist
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Verify that all scripts run and reproduce the corrected results")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of scripts to run concurrently (default: CPU count, 1 runs them sequentially)")
+    parser.add_argument('--timeout', type=float, default=300,
+                        help="per-script timeout in seconds (default: 300)")
+    parser.add_argument('--quiet', action='store_true',
+                        help="do not stream script output, only the summary report")
+    parser.add_argument('--force', action='store_true',
+                        help="re-run every script even if its cached outputs are up to date")
+    parser.add_argument('--profile', metavar='DIR',
+                        help="instrument the scripts and write timing/memory reports to DIR (implies --force)")
+    parser.add_argument('--cprofile', action='store_true',
+                        help="with --profile, also dump cProfile statistics")
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help="with --profile, also trace Python memory allocations")
+    return parser.parse_args(argv)
+
+def verification_sources():
+    """Files whose contents the verification checks depend on"""
+    return glob.glob('src/*.py') + [os.path.relpath(os.path.abspath(__file__))]
+
+def profile_env(args):
+    """Environment variables that switch on src/instrumentation.py in the scripts"""
+    if not args.profile:
+        return None
+    env = {'WFT_PROFILE_DIR': os.path.abspath(args.profile)}
+    if args.cprofile:
+        env['WFT_CPROFILE'] = '1'
+    if args.tracemalloc:
+        env['WFT_TRACEMALLOC'] = '1'
+    return env
+
+def main(argv=None):
     """Main verification function"""
+    args = parse_args(argv)
+
     print("=" * 60)
     print("WAVELENGTH FIELD THEORY - EXECUTION VERIFICATION")
     print("=" * 60)
@@ -165,28 +455,53 @@ def main():
         print("\n❌ Python version check failed")
         return False
     
-    if not check_packages():
-        print("\n❌ Package check failed")
-        print("Run: pip install numpy scipy matplotlib sympy pandas")
-        return False
-    
     if not check_scripts_exist():
         print("\n❌ Script files check failed")
         return False
     
-    # Run all scripts
-    scripts = [
-        'src/wavelength_field_validation.py',
-        'src/theoretical_foundations.py',
-        'src/comprehensive_critique_solutions.py',
-        'src/fundamental_derivations_response.py',
-        'src/enhanced_manuscript_improvements.py'
-    ]
+    # Run only the scripts whose sources, inputs or libraries changed
+    cache = BuildCache()
+    plan = plan_build(BUILD_GRAPH, cache, force=args.force or bool(args.profile))
+    print_build_plan(plan)
+    
+    # Package and numerical checks are skipped when nothing is re-run and the
+    # sources and libraries are those of the last fully verified run
+    verification = verification_key(verification_sources())
+    recheck = any(state == STALE for node, key, state in plan) or not cache.is_verified(verification)
+    if not recheck:
+        print("\n✅ Sources and libraries unchanged since the last verified run - "
+              "skipping package and numerical checks")
+    elif not check_packages():
+        print("\n❌ Package check failed")
+        print("Run: pip install numpy scipy matplotlib sympy pandas")
+        return False
+    
+    for node, key, state in plan:
+        if state == RESTORED:
+            cache.restore(node, key)
+    stale = [(node, key) for node, key, state in plan if state == STALE]
     
     all_success = True
-    for script in scripts:
-        if not run_script(script):
-            all_success = False
+    if stale:
+        print("\n🚀 Running scripts...")
+        start = time.perf_counter()
+        reports = run_scripts([node.script for node, key in stale], workers=args.workers,
+                              timeout=args.timeout, echo=not args.quiet, env=profile_env(args))
+        print_run_report(reports, time.perf_counter() - start)
+        if args.profile:
+            print_profile_summary(args.profile)
+        
+        for (node, key), report in zip(stale, reports):
+            if report['status'] != 'SUCCESS':
+                all_success = False
+                continue
+            try:
+                cache.store(node, key)
+            except FileNotFoundError as e:
+                print(f"❌ {e}")
+                all_success = False
+    else:
+        print("\n✅ All outputs up to date or restored from cache - nothing to run")
     
     if not all_success:
         print("\n❌ Some scripts failed to run")
@@ -197,9 +512,14 @@ def main():
         print("\n❌ Corrected results verification failed")
         return False
     
+    if recheck and not verify_numerical_accuracy():
+        print("\n❌ Numerical accuracy verification failed")
+        return False
+    
     if not check_output_files():
         print("\n❌ Output files check failed")
         return False
+    cache.mark_verified(verification)
     
     # Success summary
     print("\n" + "=" * 60)
@@ -217,6 +537,7 @@ def main():
     print("• Script files: ✅ Present")
     print("• Script execution: ✅ Successful")
     print("• Corrected results: ✅ Verified")
+    print("• Numerical accuracy: ✅ Verified")
     print("• Output files: ✅ Generated")
     
     print("\n🚀 READY FOR DISTRIBUTION!")